@@ -6,9 +6,11 @@ Provides lightweight chart widgets using PyQt6 QPainter for visualization
 without external dependencies. Matches the dark theme of the application.
 """
 
-from typing import List, Tuple, Dict, Optional, Any
+from typing import List, Tuple, Dict, Optional, Any, Sequence
 import math
 
+import numpy as np
+
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QHBoxLayout, QLabel, QSizePolicy
 from PyQt6.QtCore import Qt, QRect, QSize, QTimer, pyqtSignal
 from PyQt6.QtGui import (
@@ -35,6 +37,9 @@ class ChartWidget(QWidget):
         self.accent_color = QColor(0, 122, 255)  # #007aff
         self.secondary_color = QColor(255, 159, 10)  # #ff9f0a
         
+        # Layout orientation (BarChart can switch to horizontal bars)
+        self.horizontal = False
+        
         # Chart colors palette
         self.chart_colors = [
             QColor(0, 122, 255),    # Blue
@@ -74,6 +79,13 @@ class ChartWidget(QWidget):
         self.start_animation()
         self.update()
     
+    def set_data_arrays(self, labels: Sequence[str], values: Sequence[float], title: str = "",
+                        x_label: str = "", y_label: str = "") -> None:
+        """Set chart data from parallel label and value columns (e.g. NumPy arrays)"""
+        if isinstance(values, np.ndarray):
+            values = values.tolist()
+        self.set_data(list(zip(labels, values)), title, x_label, y_label)
+    
     def start_animation(self) -> None:
         """Start entrance animation"""
         self.animation_progress = 0.0
@@ -106,7 +118,7 @@ class ChartWidget(QWidget):
     
     def get_chart_rect(self) -> QRect:
         """Get the rectangle available for chart drawing"""
-        if hasattr(self, 'horizontal') and self.horizontal and self.data:
+        if self.horizontal and self.data:
             # For horizontal charts, calculate needed space for labels and value labels
             max_label_width = 0
             max_negative_value_width = 0
@@ -270,21 +282,22 @@ class BarChart(ChartWidget):
             painter.setPen(QPen(self.grid_color, 2))
             painter.drawLine(int(zero_x), rect.y(), int(zero_x), rect.bottom())
         
+        # Calculate every bar's position and width at once. Positive bars start
+        # at the zero baseline and extend right, negative bars end at it
+        value_array = np.asarray(values, dtype=np.float64)
+        bar_ys = rect.y() + spacing + np.arange(bar_count) * (bar_height + spacing / bar_count)
+        bar_widths = np.abs((value_array / value_range) * rect.width() * self.animation_progress)
+        bar_xs = np.where(value_array >= 0, zero_x, zero_x - bar_widths)
+        
+        # Text settings shared by all value and participant labels
+        font = QFont("Segoe UI", 9)
+        font_metrics = QFontMetrics(font)
+        painter.setFont(font)
+        painter.setPen(self.text_color)
+        
         # Draw bars
-        for i, (label, value) in enumerate(self.data):
-            # Calculate bar position and width
-            y = rect.y() + spacing + i * (bar_height + spacing / bar_count)
-            
-            # Calculate bar width and position based on value
-            bar_width = abs((value / value_range) * rect.width() * self.animation_progress)
-            
-            if value >= 0:
-                # Positive bar: starts at zero baseline, extends right
-                bar_x = zero_x
-            else:
-                # Negative bar: starts left of zero baseline, extends to zero baseline
-                bar_x = zero_x - bar_width
-            
+        for i, ((label, value), y, bar_x, bar_width) in enumerate(
+                zip(self.data, bar_ys.tolist(), bar_xs.tolist(), bar_widths.tolist())):
             # Color selection - use different colors for positive/negative
             if value >= 0:
                 color = self.chart_colors[i % len(self.chart_colors)]
@@ -309,12 +322,7 @@ class BarChart(ChartWidget):
             painter.fillRect(int(bar_x), int(y), int(bar_width), int(bar_height), gradient)
             
             # Draw value at appropriate end of bar
-            painter.setPen(self.text_color)
-            font = QFont("Segoe UI", 9)
-            painter.setFont(font)
-            
             value_text = f"{value:.2f}" if abs(value - int(value)) > 0.001 else f"{value:.0f}"
-            font_metrics = QFontMetrics(font)
             text_width = font_metrics.horizontalAdvance(value_text)
             
             if value >= 0:
@@ -336,9 +344,6 @@ class BarChart(ChartWidget):
             label_rect = QRect(10, int(y), rect.x() - 15, int(bar_height))
             
             # Truncate label if it's too long
-            font = QFont("Segoe UI", 9)
-            painter.setFont(font)
-            font_metrics = QFontMetrics(font)
             available_width = label_rect.width()
             
             display_label = label
@@ -8,11 +8,15 @@ NLTK and TextBlob for lightweight, fast sentiment analysis.
 
 import os
 import sys
-from typing import Dict, List, Tuple, Optional, Any
-from dataclasses import dataclass
+from typing import Callable, Dict, List, Tuple, Optional, Any
+from dataclasses import dataclass, field
 from datetime import datetime
 import re
-from collections import defaultdict, Counter
+import string
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 
 # Core dependencies
 import numpy as np
@@ -65,8 +69,67 @@ except ImportError:
 
 from parsers.base_parser import Conversation, Message
 
+# Maximum number of cleaned message texts whose scores are cached per analyzer
+SCORE_CACHE_SIZE = 16384
 
-@dataclass
+# Conversations with fewer messages than this are never scored in a process pool
+PARALLEL_MIN_MESSAGES = 2000
+
+# Number of most emotional messages kept in ConversationSentiment.emotional_peaks
+EMOTIONAL_PEAK_COUNT = 5
+
+# Sender names longer than this are truncated (with "...") for display
+SENDER_DISPLAY_NAME_LENGTH = 20
+
+# Number of progress reports made while scoring a conversation
+PROGRESS_STEPS = 100
+
+# Process-pool scoring splits the texts into this many chunks per worker, so
+# progress is reported and load is balanced at a finer grain
+PARALLEL_CHUNKS_PER_WORKER = 8
+
+# Single-participant conversations shorter than this skip peaks, mood
+# transitions and keyword extraction
+TRIVIAL_CONVERSATION_MESSAGES = 50
+
+# Patterns used by _clean_text_simple, compiled once at import. URLs and
+# mentions are dropped in one pass, before repeated punctuation is collapsed so
+# runs split by a removed URL or mention still merge. A mention takes in any
+# URLs glued to it (the lookahead and backreference keep them whole), matching
+# what removing URLs first and mentions second leaves.
+_URL_PATTERN = r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+'
+_URL_MENTION_RE = re.compile(
+    rf'{_URL_PATTERN}|@(?=((?:{_URL_PATTERN})*))\1\w(?:{_URL_PATTERN}|\w)*'
+)
+_REPEATED_PUNCT_RE = re.compile(r'([!?.]){3,}')
+
+# Mood buckets by absolute compound score, indexed from most negative to most positive
+_MOOD_EDGES = np.array([0.1, 0.5])
+_MOOD_LABELS = ("very negative", "negative", "neutral", "positive", "very positive")
+
+# Word lists for the regex fallback, each compiled into one alternation so a
+# message is scanned once per polarity
+_POSITIVE_WORDS = ('good', 'great', 'excellent', 'love', 'wonderful', 'best', 'happy', 'amazing', '😊', '😄', '❤️', '👍')
+_NEGATIVE_WORDS = ('bad', 'terrible', 'hate', 'worst', 'awful', 'horrible', 'sad', 'angry', '😢', '😡', '👎', '💔')
+_POSITIVE_RE = re.compile('|'.join(map(re.escape, _POSITIVE_WORDS)))
+_NEGATIVE_RE = re.compile('|'.join(map(re.escape, _NEGATIVE_WORDS)))
+
+# Keyword candidates: whitespace-delimited words of four or more letters/digits,
+# ignoring leading/trailing punctuation, matched in one pass
+_PUNCT_CLASS = '[' + re.escape(string.punctuation) + ']*'
+_TOKEN_RE = re.compile(r'(?<!\S)' + _PUNCT_CLASS + r'([^\W_]{4,})' + _PUNCT_CLASS + r'(?!\S)')
+
+# Stopwords used when the NLTK stopwords corpus is unavailable
+_FALLBACK_STOPWORDS = frozenset({'the', 'and', 'for', 'that', 'this', 'with', 'from', 'have', 'will', 'your', 'what', 'when', 'where', 'which', 'their', 'would', 'there', 'could', 'should', 'after', 'before', 'just', 'about', 'into', 'some', 'them', 'other', 'than', 'then', 'also', 'been', 'only', 'very', 'over', 'such', 'being', 'through'})
+
+
+@lru_cache(maxsize=None)
+def _english_stopwords() -> frozenset:
+    """Load the NLTK English stopwords once per process"""
+    return frozenset(stopwords.words('english'))
+
+
+@dataclass(slots=True)
 class SentimentScore:
     """Container for sentiment analysis results"""
     compound: float  # Overall sentiment (-1 to 1)
@@ -77,17 +140,18 @@ class SentimentScore:
     method: str  # Method used for analysis
 
 
-@dataclass
+@dataclass(slots=True)
 class ConversationSentiment:
     """Sentiment analysis results for a conversation"""
     overall_sentiment: SentimentScore
-    message_sentiments: List[Tuple[Message, SentimentScore]]
+    message_sentiments: List[Tuple[Message, SentimentScore]]  # Empty unless keep_per_message
     sentiment_by_sender: Dict[str, SentimentScore]
     sentiment_timeline: List[Tuple[datetime, float]]  # Timestamp, compound score
-    emotional_peaks: List[Tuple[Message, SentimentScore]]  # Most emotional messages
+    emotional_peaks: List[Tuple[Message, SentimentScore]]  # Top EMOTIONAL_PEAK_COUNT messages, most emotional first
     summary: str
     keywords: List[Tuple[str, int]]  # Top keywords with frequency
     mood_transitions: List[Dict[str, Any]]  # Significant mood changes
+    sender_display_names: Dict[str, str] = field(default_factory=dict)  # Sender -> truncated name for charts
 
 
 class SentimentAnalyzer:
@@ -108,7 +172,9 @@ class SentimentAnalyzer:
         self.analyzers = {}
         self.lemmatizer = None
         self.custom_lexicon = {}
-        self.stop_words = set()
+        self.stop_words: frozenset = frozenset()
+        # Message text -> score, kept across runs of this analyzer
+        self._score_cache: Dict[str, SentimentScore] = {}
         
         # Simple method selection for now
         if NLTK_AVAILABLE and method in ["auto", "nltk", "ensemble"]:
@@ -133,9 +199,9 @@ class SentimentAnalyzer:
         self.method = "nltk"
         
         try:
-            self.stop_words = set(stopwords.words('english'))
+            self.stop_words = _english_stopwords()
         except:
-            self.stop_words = {'the', 'and', 'for', 'that', 'this', 'with', 'from'}
+            self.stop_words = frozenset({'the', 'and', 'for', 'that', 'this', 'with', 'from'})
     
     def _check_available_methods(self) -> List[str]:
         """Check which sentiment analysis methods are available"""
@@ -208,9 +274,9 @@ class SentimentAnalyzer:
         self.analyzers['nltk'] = SentimentIntensityAnalyzer()
         
         try:
-            self.stop_words = set(stopwords.words('english'))
+            self.stop_words = _english_stopwords()
         except:
-            self.stop_words = {'the', 'and', 'for', 'that', 'this', 'with', 'from', 'have', 'will', 'your', 'what', 'when', 'where', 'which', 'their', 'would', 'there', 'could', 'should', 'after', 'before', 'just', 'about', 'into', 'some', 'them', 'other', 'than', 'then', 'also', 'been', 'only', 'very', 'over', 'such', 'being', 'through'}
+            self.stop_words = _FALLBACK_STOPWORDS
     
     def _init_textblob(self):
         """Initialize TextBlob sentiment analyzer"""
@@ -269,30 +335,66 @@ class SentimentAnalyzer:
         Returns:
             SentimentScore object with sentiment analysis results
         """
-        text = message.text
-        
-        if not text or len(text.strip()) < 3:
-            return SentimentScore(0.0, 0.0, 0.0, 1.0, 0.0, "none")
-        
-        # Clean text
-        text = self._clean_text_simple(text)
+        return self._analyze_texts([message.text])[0]
+    
+    def analyze_messages_batch(self, messages: List[Message]) -> List[SentimentScore]:
+        """
+        Analyze sentiment of many messages in one call
         
-        # Analyze based on method
+        Args:
+            messages: Message objects to analyze
+            
+        Returns:
+            SentimentScore objects in the same order as the messages
+        """
+        return self._analyze_texts([message.text for message in messages])
+    
+    def _analyze_texts(self, texts: List[str]) -> List[SentimentScore]:
+        """Analyze sentiment of a batch of message texts"""
+        # Empty and very short messages get a neutral result without scoring
+        neutral = SentimentScore(0.0, 0.0, 0.0, 1.0, 0.0, "none")
+        
+        # Score each distinct text once, then scatter back in order.
+        # Texts seen in earlier batches or runs reuse the cached score
+        cache = self._score_cache
+        scored = {}
+        pending = []
+        for text in dict.fromkeys(texts):
+            score = neutral if not text or len(text.strip()) < 3 else cache.get(text)
+            if score is None:
+                pending.append(text)
+            else:
+                scored[text] = score
+        if not pending:
+            return [scored[text] for text in texts]
+        
+        # Resolve the scoring method once for the whole batch
         if self.method == "nltk" and 'nltk' in self.analyzers:
-            return self._analyze_with_nltk_simple(text)
+            score_text = self._analyze_with_nltk_simple
         elif self.method == "textblob" and TEXTBLOB_AVAILABLE:
-            return self._analyze_with_textblob_simple(text)
+            score_text = self._analyze_with_textblob_simple
         else:
-            return self._analyze_with_regex(text)
+            score_text = self._analyze_with_regex
+        
+        new_scores = [score_text(self._clean_text_simple(text)) for text in pending]
+        scored.update(zip(pending, new_scores))
+        self._remember_scores(pending, new_scores)
+        
+        return [scored[text] for text in texts]
+    
+    def _remember_scores(self, texts: List[str], scores: List[SentimentScore]) -> None:
+        """Add freshly scored texts to the score cache, up to SCORE_CACHE_SIZE entries"""
+        cache = self._score_cache
+        room = SCORE_CACHE_SIZE - len(cache)
+        if room > 0:
+            cache.update(zip(texts[:room], scores[:room]))
     
     def _clean_text_simple(self, text: str) -> str:
         """Simple text cleaning"""
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        # Remove mentions
-        text = re.sub(r'@\w+', '', text)
+        # Remove URLs and mentions
+        text = _URL_MENTION_RE.sub('', text)
         # Remove excessive punctuation but keep emoticons
-        text = re.sub(r'([!?.]){3,}', r'\1', text)
+        text = _REPEATED_PUNCT_RE.sub(r'\1', text)
         return text.strip()
     
     def _analyze_with_nltk_simple(self, text: str) -> SentimentScore:
@@ -633,12 +735,9 @@ class SentimentAnalyzer:
         """Basic regex-based sentiment analysis as ultimate fallback"""
         text_lower = text.lower()
         
-        # Simple positive/negative word lists
-        positive_words = ['good', 'great', 'excellent', 'love', 'wonderful', 'best', 'happy', 'amazing', '😊', '😄', '❤️', '👍']
-        negative_words = ['bad', 'terrible', 'hate', 'worst', 'awful', 'horrible', 'sad', 'angry', '😢', '😡', '👎', '💔']
-        
-        pos_count = sum(1 for word in positive_words if word in text_lower)
-        neg_count = sum(1 for word in negative_words if word in text_lower)
+        # Each listed word counts once, however often it appears
+        pos_count = len(set(_POSITIVE_RE.findall(text_lower)))
+        neg_count = len(set(_NEGATIVE_RE.findall(text_lower)))
         
         total = pos_count + neg_count
         if total == 0:
@@ -658,12 +757,20 @@ class SentimentAnalyzer:
             method="regex"
         )
     
-    def analyze_conversation(self, conversation: Conversation) -> ConversationSentiment:
+    def analyze_conversation(self, conversation: Conversation,
+                             keep_per_message: bool = True,
+                             progress_callback: Optional[Callable[[int, int], None]] = None) -> ConversationSentiment:
         """
         Perform comprehensive sentiment analysis on a conversation
         
         Args:
             conversation: Conversation object to analyze
+            keep_per_message: Keep the (message, score) pair of every message in
+                message_sentiments. Pass False for long conversations to return
+                only the aggregates, timeline and peaks (message_sentiments is
+                then empty)
+            progress_callback: Called with (texts scored, texts to score) as
+                scoring advances. An exception raised from it aborts the analysis
             
         Returns:
             ConversationSentiment object with detailed analysis
@@ -671,40 +778,328 @@ class SentimentAnalyzer:
         if not conversation.messages:
             return self._empty_sentiment_result()
         
-        # Analyze each message
-        message_sentiments = []
-        sentiment_by_sender = defaultdict(list)
-        sentiment_timeline = []
+        scores = self._score_messages(conversation.messages, progress_callback)
+        return self._build_conversation_sentiment(conversation, scores, keep_per_message)
+    
+    def _score_messages(self, messages: List[Message],
+                        progress_callback: Optional[Callable[[int, int], None]] = None) -> List[SentimentScore]:
+        """Score messages in-process, reporting progress in PROGRESS_STEPS steps"""
+        if progress_callback is None:
+            return self.analyze_messages_batch(messages)
+        
+        texts = [message.text for message in messages]
+        step = max(1, len(texts) // PROGRESS_STEPS)
+        scores = []
+        for start in range(0, len(texts), step):
+            scores.extend(self._analyze_texts(texts[start:start + step]))
+            progress_callback(len(scores), len(texts))
+        return scores
+    
+    def analyze_conversation_parallel(self, conversation: Conversation,
+                                      workers: Optional[int] = None,
+                                      keep_per_message: bool = True,
+                                      progress_callback: Optional[Callable[[int, int], None]] = None) -> ConversationSentiment:
+        """
+        Perform sentiment analysis on a conversation using a process pool
         
-        for message in conversation.messages:
-            sentiment = self.analyze_message(message)
-            message_sentiments.append((message, sentiment))
-            sentiment_by_sender[message.sender_id].append(sentiment)
-            sentiment_timeline.append((message.timestamp, sentiment.compound))
+        Distinct message texts are split into chunks that are scored in
+        separate processes, each with its own analyzer. Small conversations
+        and the cheap regex fallback are analyzed serially since the pool
+        startup would dominate.
         
-        # Calculate overall sentiment
-        overall_sentiment = self._calculate_average_sentiment(
-            [s for _, s in message_sentiments]
+        Args:
+            conversation: Conversation object to analyze
+            workers: Number of worker processes (defaults to the CPU count)
+            keep_per_message: See analyze_conversation
+            progress_callback: See analyze_conversation
+            
+        Returns:
+            ConversationSentiment object with detailed analysis
+        """
+        if not conversation.messages:
+            return self._empty_sentiment_result()
+        
+        scores, word_freq = self._score_conversation(conversation, workers, progress_callback)
+        return self._build_conversation_sentiment(conversation, scores, keep_per_message, word_freq)
+    
+    def _score_conversation(self, conversation: Conversation, workers: Optional[int] = None,
+                            progress_callback: Optional[Callable[[int, int], None]] = None
+                            ) -> Tuple[List[SentimentScore], Optional[Counter]]:
+        """
+        Score a conversation's messages, in a process pool when it is large enough
+        
+        Returns the scores in message order, and the keyword counts when the
+        pool counted them along the way (None otherwise)
+        """
+        messages = conversation.messages
+        workers = workers or os.cpu_count() or 1
+        if len(messages) < PARALLEL_MIN_MESSAGES or workers < 2 or self.method == "regex":
+            return self._score_messages(messages, progress_callback), None
+        
+        # Only ship each distinct, not yet cached text to the workers once
+        texts = [message.text for message in messages]
+        word_freq = None
+        cache = self._score_cache
+        unique_texts = dict.fromkeys(texts)
+        scored = {text: cache[text] for text in unique_texts if text in cache}
+        pending = [text for text in unique_texts if text not in scored]
+        
+        if pending:
+            # Longest texts first: chunks hold texts of similar cost, and the
+            # expensive chunks start early while cheap ones fill in at the end
+            pending.sort(key=lambda text: len(text or ""), reverse=True)
+            chunk_size = -(-len(pending) // (workers * PARALLEL_CHUNKS_PER_WORKER))
+            chunks = [pending[i:i + chunk_size] for i in range(0, len(pending), chunk_size)]
+            
+            new_scores = []
+            with ProcessPoolExecutor(max_workers=workers) as pool:
+                # Count keywords in the same pool, one shard of messages per worker
+                keyword_jobs = []
+                if NLTK_AVAILABLE:
+                    stop = self.stop_words or _FALLBACK_STOPWORDS
+                    shard_size = -(-len(texts) // workers)
+                    keyword_jobs = [
+                        pool.submit(_count_keywords, texts[i:i + shard_size], stop)
+                        for i in range(0, len(texts), shard_size)
+                    ]
+                
+                # Results arrive in chunk order; leaving the loop early cancels
+                # the chunks that have not started yet
+                for chunk_scores in pool.map(_score_chunk, [self.method] * len(chunks), chunks):
+                    new_scores.extend(chunk_scores)
+                    if progress_callback is not None:
+                        progress_callback(len(new_scores), len(pending))
+                
+                # Merging shards in order keeps first-seen order for ties
+                if keyword_jobs:
+                    word_freq = Counter()
+                    for job in keyword_jobs:
+                        word_freq.update(job.result())
+            scored.update(zip(pending, new_scores))
+            self._remember_scores(pending, new_scores)
+        
+        return [scored[text] for text in texts], word_freq
+    
+    def analyze_conversations(self, conversations: List[Conversation],
+                              workers: Optional[int] = None,
+                              keep_per_message: bool = True,
+                              progress_callback: Optional[Callable[[int, int], None]] = None) -> ConversationSentiment:
+        """
+        Perform sentiment analysis across several conversations at once
+        
+        Each conversation is analyzed on its own (large ones in a process
+        pool) and the results are merged, so mood transitions and the
+        timeline never pair messages from different conversations.
+        
+        Args:
+            conversations: Conversation objects to analyze
+            workers: Number of worker processes (defaults to the CPU count)
+            keep_per_message: See analyze_conversation
+            progress_callback: Called with (messages scored, messages to
+                score) across all conversations; see analyze_conversation
+            
+        Returns:
+            ConversationSentiment object for the combined conversations
+        """
+        conversations = [conversation for conversation in conversations if conversation.messages]
+        if not conversations:
+            return self._empty_sentiment_result()
+        if len(conversations) == 1:
+            return self.analyze_conversation_parallel(
+                conversations[0], workers, keep_per_message, progress_callback
+            )
+        
+        total = sum(len(conversation.messages) for conversation in conversations)
+        offset = 0
+        results = []
+        word_freqs = []
+        for conversation in conversations:
+            size = len(conversation.messages)
+            report = None
+            if progress_callback is not None:
+                # Scale the conversation's own progress to its share of all messages
+                def report(done, count, offset=offset, size=size):
+                    progress_callback(offset + done * size // max(count, 1), total)
+            scores, word_freq = self._score_conversation(conversation, workers, report)
+            if word_freq is None:
+                word_freq = self._count_conversation_keywords(conversation)
+            results.append(self._build_conversation_sentiment(conversation, scores, keep_per_message, word_freq))
+            word_freqs.append(word_freq)
+            offset += size
+        
+        return self._merge_conversation_sentiments(conversations, results, word_freqs)
+    
+    def analyze_conversations_from_scores(self, conversations: List[Conversation],
+                                          scores: List[List[SentimentScore]],
+                                          keep_per_message: bool = True) -> ConversationSentiment:
+        """
+        Rebuild the analysis of several conversations from stored message scores
+        
+        Args:
+            conversations: Conversation objects that were analyzed
+            scores: One list of scores per conversation, in message order
+            keep_per_message: See analyze_conversation
+            
+        Returns:
+            ConversationSentiment object, as analyze_conversations returns it
+        """
+        pairs = [(conversation, conversation_scores)
+                 for conversation, conversation_scores in zip(conversations, scores) if conversation.messages]
+        if not pairs:
+            return self._empty_sentiment_result()
+        conversations = [conversation for conversation, _ in pairs]
+        word_freqs = [self._count_conversation_keywords(conversation) for conversation in conversations]
+        results = [
+            self._build_conversation_sentiment(conversation, conversation_scores, keep_per_message, word_freq)
+            for (conversation, conversation_scores), word_freq in zip(pairs, word_freqs)
+        ]
+        if len(results) == 1:
+            return results[0]
+        return self._merge_conversation_sentiments(conversations, results, word_freqs)
+    
+    def _count_conversation_keywords(self, conversation: Conversation) -> Optional[Counter]:
+        """Count keyword candidates in a conversation's messages (None without NLTK)"""
+        if not NLTK_AVAILABLE:
+            return None
+        return _count_keywords([message.text for message in conversation.messages],
+                               self.stop_words or _FALLBACK_STOPWORDS)
+    
+    def _merge_conversation_sentiments(self, conversations: List[Conversation],
+                                       results: List[ConversationSentiment],
+                                       word_freqs: List[Optional[Counter]]) -> ConversationSentiment:
+        """
+        Combine the separately analyzed sentiments of several conversations
+        
+        Overall and per-sender scores are averaged weighted by message count,
+        matching an average over every message. Timelines, per-message scores
+        and mood transitions are concatenated in conversation order, and the
+        emotional peaks are the strongest of each conversation's peaks. The
+        keywords come from the sum of each conversation's keyword counts.
+        """
+        overall_sentiment = self._weighted_average_score(
+            [result.overall_sentiment for result in results],
+            [len(conversation.messages) for conversation in conversations]
+        )
+        
+        sender_scores: Dict[str, List[SentimentScore]] = {}
+        sender_weights: Dict[str, List[int]] = {}
+        for conversation, result in zip(conversations, results):
+            counts = Counter(message.sender_id for message in conversation.messages)
+            for sender, score in result.sentiment_by_sender.items():
+                sender_scores.setdefault(sender, []).append(score)
+                sender_weights.setdefault(sender, []).append(counts[sender])
+        sentiment_by_sender = {
+            sender: self._weighted_average_score(scores, sender_weights[sender])
+            for sender, scores in sender_scores.items()
+        }
+        
+        # Most emotional first; earlier messages win ties
+        emotional_peaks = sorted(
+            chain.from_iterable(result.emotional_peaks for result in results),
+            key=lambda peak: (-abs(peak[1].compound), peak[0].timestamp)
+        )[:EMOTIONAL_PEAK_COUNT]
+        
+        sentiment_timeline = list(chain.from_iterable(result.sentiment_timeline for result in results))
+        mood_transitions = list(chain.from_iterable(result.mood_transitions for result in results))
+        
+        # The summary and keywords describe the selection as a whole; summing
+        # the counts in conversation order keeps first-seen order for ties
+        combined = Conversation(
+            id="combined",
+            participants=list(dict.fromkeys(
+                participant for conversation in conversations for participant in conversation.participants
+            )),
+            messages=list(chain.from_iterable(conversation.messages for conversation in conversations)),
+            line_number=0
+        )
+        compounds = np.fromiter(
+            (score for _, score in sentiment_timeline), dtype=np.float64, count=len(sentiment_timeline)
         )
+        keywords = []
+        if len(combined.participants) > 1 or len(combined.messages) >= TRIVIAL_CONVERSATION_MESSAGES:
+            word_freq = Counter()
+            for conversation_freq in word_freqs:
+                if conversation_freq:
+                    word_freq.update(conversation_freq)
+            keywords = self._extract_keywords(combined, word_freq=word_freq)
+        
+        sender_display_names = {}
+        for result in results:
+            sender_display_names.update(result.sender_display_names)
         
-        # Calculate per-sender sentiment
-        sender_sentiments = {}
-        for sender, sentiments in sentiment_by_sender.items():
-            sender_sentiments[sender] = self._calculate_average_sentiment(sentiments)
+        return ConversationSentiment(
+            overall_sentiment=overall_sentiment,
+            message_sentiments=list(chain.from_iterable(result.message_sentiments for result in results)),
+            sentiment_by_sender=sentiment_by_sender,
+            sentiment_timeline=sentiment_timeline,
+            emotional_peaks=emotional_peaks,
+            summary=self._generate_conversation_summary(
+                combined, compounds, overall_sentiment, mood_transitions
+            ),
+            keywords=keywords,
+            mood_transitions=mood_transitions,
+            sender_display_names=sender_display_names
+        )
+    
+    def _build_conversation_sentiment(self, conversation: Conversation,
+                                      scores: List[SentimentScore],
+                                      keep_per_message: bool = True,
+                                      word_freq: Optional[Counter] = None) -> ConversationSentiment:
+        """
+        Aggregate per-message scores into a ConversationSentiment
+        
+        word_freq may hold keyword counts already computed for the conversation
+        """
+        messages = conversation.messages
+        
+        # Per-message score columns, shared by every aggregate below
+        values = self._score_matrix(scores)
+        compounds = values[:, 0]
+        
+        # Flatten the message attributes once instead of per aggregate
+        timestamps = [message.timestamp for message in messages]
+        senders = [message.sender_id for message in messages]
+        message_sentiments = list(zip(messages, scores)) if keep_per_message else []
+        sentiment_timeline = list(zip(timestamps, compounds.tolist()))
+        
+        # Calculate overall and per-sender sentiment from one grouped pass
+        overall_sentiment, sender_sentiments = self._aggregate_scores(senders, values)
+        sender_display_names = {
+            sender: sender[:SENDER_DISPLAY_NAME_LENGTH] + "..." if len(sender) > SENDER_DISPLAY_NAME_LENGTH else sender
+            for sender in sender_sentiments
+        }
+        
+        # Fast path for trivial conversations (a single participant and only a
+        # few messages): peaks, mood shifts and keywords carry no meaning there
+        if (len(conversation.participants) <= 1
+                and len(messages) < TRIVIAL_CONVERSATION_MESSAGES):
+            return ConversationSentiment(
+                overall_sentiment=overall_sentiment,
+                message_sentiments=message_sentiments,
+                sentiment_by_sender=sender_sentiments,
+                sentiment_timeline=sentiment_timeline,
+                emotional_peaks=[],
+                summary=self._generate_conversation_summary(
+                    conversation, compounds, overall_sentiment, []
+                ),
+                keywords=[],
+                mood_transitions=[],
+                sender_display_names=sender_display_names
+            )
         
         # Find emotional peaks (most positive and negative messages)
-        emotional_peaks = self._find_emotional_peaks(message_sentiments)
+        emotional_peaks = self._find_emotional_peaks(messages, scores, compounds)
         
         # Detect mood transitions
         mood_transitions = self._detect_mood_transitions(sentiment_timeline)
         
         # Generate summary
         summary = self._generate_conversation_summary(
-            conversation, message_sentiments, overall_sentiment
+            conversation, compounds, overall_sentiment, mood_transitions
         )
         
         # Extract keywords
-        keywords = self._extract_keywords(conversation)
+        keywords = self._extract_keywords(conversation, word_freq=word_freq)
         
         return ConversationSentiment(
             overall_sentiment=overall_sentiment,
@@ -714,19 +1109,16 @@ class SentimentAnalyzer:
             emotional_peaks=emotional_peaks,
             summary=summary,
             keywords=keywords,
-            mood_transitions=mood_transitions
+            mood_transitions=mood_transitions,
+            sender_display_names=sender_display_names
         )
     
-    def _calculate_average_sentiment(self, sentiments: List[SentimentScore]) -> SentimentScore:
-        """Calculate average sentiment from a list of sentiment scores"""
-        if not sentiments:
+    def _average_score_rows(self, values: np.ndarray) -> SentimentScore:
+        """Average an (N, 5) score matrix into a single SentimentScore"""
+        if not len(values):
             return SentimentScore(0, 0, 0, 1, 0, "average")
         
-        avg_compound = np.mean([s.compound for s in sentiments])
-        avg_positive = np.mean([s.positive for s in sentiments])
-        avg_negative = np.mean([s.negative for s in sentiments])
-        avg_neutral = np.mean([s.neutral for s in sentiments])
-        avg_confidence = np.mean([s.confidence for s in sentiments])
+        avg_compound, avg_positive, avg_negative, avg_neutral, avg_confidence = values.mean(axis=0)
         
         return SentimentScore(
             compound=avg_compound,
@@ -737,17 +1129,66 @@ class SentimentAnalyzer:
             method="average"
         )
     
-    def _find_emotional_peaks(self, message_sentiments: List[Tuple[Message, SentimentScore]], 
-                             top_n: int = 5) -> List[Tuple[Message, SentimentScore]]:
-        """Find the most emotionally charged messages"""
-        # Sort by absolute compound score (most emotional)
-        sorted_sentiments = sorted(
-            message_sentiments,
-            key=lambda x: abs(x[1].compound),
-            reverse=True
+    def _weighted_average_score(self, sentiments: List[SentimentScore], weights: List[int]) -> SentimentScore:
+        """Average sentiment scores weighted by the number of messages behind each"""
+        weight_array = np.asarray(weights, dtype=np.float64)
+        return SentimentScore(
+            *(weight_array @ self._score_matrix(sentiments) / weight_array.sum()), method="average"
+        )
+    
+    def _score_matrix(self, sentiments: List[SentimentScore]) -> np.ndarray:
+        """Stack sentiment scores into an (N, 5) array of compound, positive, negative, neutral, confidence"""
+        return np.fromiter(
+            (v for s in sentiments for v in (s.compound, s.positive, s.negative, s.neutral, s.confidence)),
+            dtype=np.float64, count=5 * len(sentiments)
+        ).reshape(-1, 5)
+    
+    def _aggregate_scores(self, senders: List[str],
+                          values: np.ndarray) -> Tuple[SentimentScore, Dict[str, SentimentScore]]:
+        """Average an (N, 5) score matrix overall and per sender"""
+        if not len(values):
+            return self._average_score_rows(values), {}
+        
+        unique_senders, first_index, inverse = np.unique(
+            np.asarray(senders), return_index=True, return_inverse=True
         )
+        # Grouped sums per score column (bincount is much faster than np.add.at)
+        sums = np.column_stack([
+            np.bincount(inverse, weights=column, minlength=len(unique_senders))
+            for column in values.T
+        ])
+        means = sums / np.bincount(inverse)[:, None]
+        
+        # The per-sender sums already cover every message, so the overall
+        # mean needs no second pass over the rows
+        overall_sentiment = SentimentScore(*(sums.sum(axis=0) / len(values)), method="average")
+        
+        # Keep senders in order of first appearance
+        sender_sentiments = {
+            str(unique_senders[i]): SentimentScore(*means[i], method="average")
+            for i in np.argsort(first_index)
+        }
+        return overall_sentiment, sender_sentiments
+    
+    def _find_emotional_peaks(self, messages: List[Message], scores: List[SentimentScore],
+                             compounds: np.ndarray, top_n: int = EMOTIONAL_PEAK_COUNT) -> List[Tuple[Message, SentimentScore]]:
+        """Find the most emotionally charged messages"""
+        n = len(messages)
+        k = min(top_n, n)
+        if k <= 0:
+            return []
+        
+        # Select the top_n absolute compound scores (most emotional) in O(N)
+        abs_compound = np.abs(compounds)
+        threshold = abs_compound[np.argpartition(abs_compound, n - k)[n - k]]
+        above = np.flatnonzero(abs_compound > threshold)
+        ties = np.flatnonzero(abs_compound == threshold)[:k - len(above)]
+        top = np.concatenate((above, ties))
+        
+        # Most emotional first; earlier messages win ties
+        top = top[np.lexsort((top, -abs_compound[top]))]
         
-        return sorted_sentiments[:top_n]
+        return [(messages[i], scores[i]) for i in top]
     
     def _detect_mood_transitions(self, sentiment_timeline: List[Tuple[datetime, float]], 
                                 threshold: float = 0.5) -> List[Dict[str, Any]]:
@@ -757,44 +1198,39 @@ class SentimentAnalyzer:
         if len(sentiment_timeline) < 2:
             return transitions
         
-        for i in range(1, len(sentiment_timeline)):
-            prev_time, prev_sentiment = sentiment_timeline[i-1]
-            curr_time, curr_sentiment = sentiment_timeline[i]
-            
-            change = curr_sentiment - prev_sentiment
-            
-            if abs(change) >= threshold:
-                transitions.append({
-                    'timestamp': curr_time,
-                    'from_sentiment': prev_sentiment,
-                    'to_sentiment': curr_sentiment,
-                    'change': change,
-                    'direction': 'positive' if change > 0 else 'negative'
-                })
+        scores = np.fromiter(
+            (score for _, score in sentiment_timeline), dtype=np.float64, count=len(sentiment_timeline)
+        )
+        changes = np.diff(scores)
+        
+        # Only build entries for the steps that cross the threshold
+        for i in np.flatnonzero(np.abs(changes) >= threshold).tolist():
+            change = float(changes[i])
+            transitions.append({
+                'timestamp': sentiment_timeline[i + 1][0],
+                'from_sentiment': sentiment_timeline[i][1],
+                'to_sentiment': sentiment_timeline[i + 1][1],
+                'change': change,
+                'direction': 'positive' if change > 0 else 'negative'
+            })
         
         return transitions
     
     def _generate_conversation_summary(self, conversation: Conversation,
-                                      message_sentiments: List[Tuple[Message, SentimentScore]],
-                                      overall_sentiment: SentimentScore) -> str:
+                                      compounds: np.ndarray,
+                                      overall_sentiment: SentimentScore,
+                                      mood_transitions: List[Dict[str, Any]]) -> str:
         """Generate a text summary of the conversation sentiment"""
         total_messages = len(conversation.messages)
         
-        # Determine overall mood
-        if overall_sentiment.compound > 0.5:
-            mood = "very positive"
-        elif overall_sentiment.compound > 0.1:
-            mood = "positive"
-        elif overall_sentiment.compound < -0.5:
-            mood = "very negative"
-        elif overall_sentiment.compound < -0.1:
-            mood = "negative"
-        else:
-            mood = "neutral"
+        # Determine overall mood: |compound| > 0.1 is (positive|negative), > 0.5 is very
+        compound = overall_sentiment.compound
+        intensity = int(np.digitize(abs(compound), _MOOD_EDGES, right=True))
+        mood = _MOOD_LABELS[2 + intensity if compound > 0 else 2 - intensity]
         
         # Count sentiment distribution
-        positive_count = sum(1 for _, s in message_sentiments if s.compound > 0.1)
-        negative_count = sum(1 for _, s in message_sentiments if s.compound < -0.1)
+        positive_count = int((compounds > 0.1).sum())
+        negative_count = int((compounds < -0.1).sum())
         neutral_count = total_messages - positive_count - negative_count
         
         # Create summary
@@ -808,45 +1244,47 @@ class SentimentAnalyzer:
             summary_parts.append(f"The conversation involves {len(conversation.participants)} participants.")
         
         # Note any significant mood shifts
-        transitions = self._detect_mood_transitions(
-            [(m.timestamp, s.compound) for m, s in message_sentiments]
-        )
-        if transitions:
-            summary_parts.append(f"There were {len(transitions)} significant mood shifts during the conversation.")
+        if mood_transitions:
+            summary_parts.append(f"There were {len(mood_transitions)} significant mood shifts during the conversation.")
         
         return " ".join(summary_parts)
     
-    def _extract_keywords(self, conversation: Conversation, top_n: int = 10) -> List[Tuple[str, int]]:
-        """Extract top keywords from the conversation"""
+    def _extract_keywords(self, conversation: Conversation, top_n: int = 10,
+                          high_quality: bool = False,
+                          word_freq: Optional[Counter] = None) -> List[Tuple[str, int]]:
+        """
+        Extract top keywords from the conversation
+        
+        Args:
+            conversation: Conversation to extract keywords from
+            top_n: Number of keywords to return
+            high_quality: Tokenize with NLTK's word_tokenize instead of a
+                whitespace split (much slower, near-identical counts)
+            word_freq: Keyword counts already computed for the conversation
+        """
         if not NLTK_AVAILABLE:
             return []
         
-        # Combine all message texts
-        all_text = " ".join([msg.text for msg in conversation.messages])
+        if word_freq is not None:
+            return word_freq.most_common(top_n)
         
-        # Tokenize and filter
-        try:
-            tokens = word_tokenize(all_text.lower())
-        except:
-            # If punkt tokenizer not available, use simple split
-            tokens = all_text.lower().split()
-        
-        # Filter out stopwords and short words
-        if hasattr(self, 'stop_words'):
-            filtered_tokens = [
-                token for token in tokens 
-                if token.isalnum() and len(token) > 3 and token not in self.stop_words
-            ]
-        else:
-            # Basic filtering without NLTK stopwords
-            common_words = {'the', 'and', 'for', 'that', 'this', 'with', 'from', 'have', 'will', 'your', 'what', 'when', 'where', 'which', 'their', 'would', 'there', 'could', 'should', 'after', 'before', 'just', 'about', 'into', 'some', 'them', 'other', 'than', 'then', 'also', 'been', 'only', 'very', 'over', 'such', 'being', 'through'}
-            filtered_tokens = [
-                token for token in tokens 
-                if token.isalnum() and len(token) > 3 and token not in common_words
-            ]
+        stop = self.stop_words or _FALLBACK_STOPWORDS
         
-        # Count frequencies
-        word_freq = Counter(filtered_tokens)
+        # Tokenize message by message instead of joining the whole conversation
+        if high_quality:
+            try:
+                word_tokenize("")
+                tokenize = word_tokenize
+            except:
+                # If punkt tokenizer not available, use simple split
+                tokenize = str.split
+            tokens = chain.from_iterable(tokenize(msg.text.lower()) for msg in conversation.messages if msg.text)
+            word_freq = Counter(
+                token for token in tokens
+                if len(token) > 3 and token.isalnum() and token not in stop
+            )
+        else:
+            word_freq = _count_keywords([msg.text for msg in conversation.messages], stop)
         
         return word_freq.most_common(top_n)
     
@@ -881,4 +1319,26 @@ class SentimentAnalyzer:
         elif self.method == "textblob":
             return message_count * 0.008  # ~8ms per message
         else:
-            return message_count * 0.005  # ~5ms per message for regex
\ No newline at end of file
+            return message_count * 0.005  # ~5ms per message for regex
+
+
+# Analyzers created inside worker processes, keyed by method
+_WORKER_ANALYZERS: Dict[str, SentimentAnalyzer] = {}
+
+
+def _count_keywords(texts: List[str], stop_words: frozenset) -> Counter:
+    """Count keyword candidates in message texts (also run in worker processes)"""
+    # The token regex already strips punctuation and enforces the length and
+    # alphanumeric rules
+    tokens = chain.from_iterable(_TOKEN_RE.findall(text.lower()) for text in texts if text)
+    
+    # Count while streaming tokens, without materializing the token list
+    return Counter(token for token in tokens if token not in stop_words)
+
+
+def _score_chunk(method: str, texts: List[str]) -> List[SentimentScore]:
+    """Score a chunk of message texts inside a worker process"""
+    analyzer = _WORKER_ANALYZERS.get(method)
+    if analyzer is None:
+        analyzer = _WORKER_ANALYZERS[method] = SentimentAnalyzer(method=method)
+    return analyzer._analyze_texts(texts)
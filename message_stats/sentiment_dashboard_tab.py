@@ -7,7 +7,15 @@ Integrates sentiment analysis into the Message-Maestro statistics dashboard
 
 from typing import List, Dict, Optional, Any
 from datetime import datetime
+from pathlib import Path
+import hashlib
+import pickle
+from operator import itemgetter
+from bisect import bisect_left
 import sys
+import time
+
+import numpy as np
 
 from PyQt6.QtWidgets import (
     QWidget, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -26,6 +34,60 @@ from message_stats.sentiment_analyzer import (
 
 # Import sentiment analysis components
 
+# Minimum seconds between progress signals sent to the UI thread (~30 Hz)
+PROGRESS_EMIT_INTERVAL = 1 / 30
+
+# How long the completion notice stays visible, in milliseconds
+COMPLETION_NOTICE_MS = 3000
+
+# Finished analyses are stored here, keyed by analyzer settings and conversation contents
+SENTIMENT_CACHE_DIR = Path.home() / '.cache' / 'message-maestro' / 'sentiment'
+
+# Stored analyses kept on disk; the least recently used are deleted first
+SENTIMENT_CACHE_MAX_FILES = 32
+
+# Bumped whenever the stored format changes, so older files are never loaded
+SENTIMENT_CACHE_VERSION = 2
+
+# Maximum number of points drawn on the sentiment timeline
+TIMELINE_MAX_POINTS = 50
+
+
+def _lttb_indices(values: np.ndarray, n_out: int) -> np.ndarray:
+    """
+    Pick n_out indices that preserve the visual shape of a series
+    (Largest-Triangle-Three-Buckets, with the index as the x coordinate)
+    """
+    n = len(values)
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+    
+    # First and last points are always kept; the rest come one per bucket
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0], indices[-1] = 0, n - 1
+    
+    previous = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        
+        # Average of the next bucket is the third triangle corner
+        avg_x = (end + next_end - 1) / 2
+        avg_y = values[end:next_end].mean()
+        
+        xs = np.arange(start, end)
+        areas = np.abs((previous - avg_x) * (values[start:end] - values[previous])
+                       - (previous - xs) * (avg_y - values[previous]))
+        previous = start + int(areas.argmax())
+        indices[i + 1] = previous
+    
+    return indices
+
+
+class _AnalysisStopped(Exception):
+    """Raised from the progress callback to abandon a stopped analysis"""
+
 
 class SentimentAnalysisThread(QThread):
     """Background thread for sentiment analysis"""
@@ -34,28 +96,45 @@ class SentimentAnalysisThread(QThread):
     analysisComplete = pyqtSignal(object)  # ConversationSentiment
     errorOccurred = pyqtSignal(str)
     
-    def __init__(self, conversation: Conversation, analyzer: SentimentAnalyzer):
+    def __init__(self, conversations: List[Conversation], analyzer: SentimentAnalyzer):
         super().__init__()
-        self.conversation = conversation
+        self.conversations = conversations
         self.analyzer = analyzer
         self.should_stop = False
+        self._last_emit = 0.0
     
     def run(self):
         try:
-            total_messages = len(self.conversation.messages)
-            
             # Start analysis
             self.progressUpdate.emit(0, "Starting sentiment analysis...")
             
-            # Analyze conversation (the analyzer handles batching internally)
-            sentiment_result = self.analyzer.analyze_conversation(self.conversation)
+            # Analyze every conversation together (large selections are scored across processes)
+            sentiment_result = self.analyzer.analyze_conversations(
+                self.conversations, progress_callback=self._on_progress
+            )
             
             self.progressUpdate.emit(100, "Analysis complete!")
             self.analysisComplete.emit(sentiment_result)
             
+        except _AnalysisStopped:
+            pass
         except Exception as e:
             self.errorOccurred.emit(str(e))
     
+    def _on_progress(self, done: int, total: int):
+        """Report scoring progress and stop early when requested"""
+        if self.should_stop:
+            raise _AnalysisStopped()
+        
+        # Coalesce updates so the UI thread is not flooded with queued signals
+        now = time.monotonic()
+        if now - self._last_emit < PROGRESS_EMIT_INTERVAL and done < total:
+            return
+        self._last_emit = now
+        
+        # Keep the last percent for the aggregation that follows scoring
+        self.progressUpdate.emit(min(99, done * 100 // total), f"Scored {done}/{total} messages...")
+    
     def stop(self):
         self.should_stop = True
 
@@ -63,12 +142,35 @@ class SentimentAnalysisThread(QThread):
 class SentimentDashboardTab(QWidget):
     """Sentiment analysis tab for the statistics dashboard"""
     
+    # Sentiment card buckets by absolute compound score: |c| > 0.1 is
+    # (positive|negative), > 0.5 is very, indexed from most negative to most positive
+    _CARD_EDGES = (0.1, 0.5)
+    _CARD_STYLES = (
+        ("#ff4444", "Very Negative", "😔"),
+        ("#ff8888", "Negative", "😐"),
+        ("#ffff88", "Neutral", "😶"),
+        ("#88ff88", "Positive", "🙂"),
+        ("#44ff44", "Very Positive", "😊"),
+    )
+    
     def __init__(self, conversations: List[Conversation] = None, parent=None):
         super().__init__(parent)
         self.conversations = conversations or []
         self.analyzer = None
         self.current_sentiment = None
         self.analysis_thread = None
+        # Analyzers per requested method, reused across runs together with
+        # their message score caches
+        self._analyzer_cache: Dict[str, SentimentAnalyzer] = {}
+        # Disk cache file for the analysis currently running
+        self._result_cache_file: Optional[Path] = None
+        # Placeholder shown until the first analysis starts (built on demand)
+        self.setup_label: Optional[QLabel] = None
+        # Hides the completion notice; restarted by each new notice
+        self._notice_timer = QTimer(self)
+        self._notice_timer.setSingleShot(True)
+        self._notice_timer.setInterval(COMPLETION_NOTICE_MS)
+        self._notice_timer.timeout.connect(self._hide_completion_notice)
         
         self.setup_ui()
         self.check_availability()
@@ -380,16 +482,13 @@ class SentimentDashboardTab(QWidget):
                 self.warning_label.setText("ℹ️ TextBlob not available. Using NLTK only.")
             elif TEXTBLOB_AVAILABLE:
                 self.warning_label.setText("ℹ️ NLTK not available. Using TextBlob only.")
-        self.analyze_btn.setEnabled(
-            NLTK_AVAILABLE or TEXTBLOB_AVAILABLE or True  # Always allow AI attempt
-        )
     
     def load_conversations(self, conversations: List[Conversation]):
         """Load conversations for sentiment analysis"""
         self.conversations = conversations
         # Reset any existing analysis
         self.current_sentiment = None
-        if hasattr(self, 'analysis_thread') and self.analysis_thread is not None:
+        if self.analysis_thread is not None:
             self.stop_analysis()
         # Show setup message again if needed
         if not conversations:
@@ -400,7 +499,7 @@ class SentimentDashboardTab(QWidget):
     
     def show_setup_message(self):
         """Show initial setup message"""
-        if not hasattr(self, 'setup_label'):
+        if self.setup_label is None:
             self.setup_label = QLabel(
                 "Configure sentiment analysis settings above and click 'Start Analysis' to begin.\n\n"
                 "• NLTK VADER: Fast, good for social media text\n"
@@ -413,7 +512,7 @@ class SentimentDashboardTab(QWidget):
     
     def hide_setup_message(self):
         """Hide setup message when analysis starts"""
-        if hasattr(self, 'setup_label'):
+        if self.setup_label is not None:
             self.setup_label.hide()
             self.results_splitter.show()
     
@@ -431,8 +530,10 @@ class SentimentDashboardTab(QWidget):
         selected_method = method_map[self.method_group.checkedId()]
         
         try:
-            # Initialize analyzer
-            self.analyzer = SentimentAnalyzer(method=selected_method)
+            # Initialize analyzer (the lexicons are only loaded once per method)
+            self.analyzer = self._analyzer_cache.get(selected_method)
+            if self.analyzer is None:
+                self.analyzer = self._analyzer_cache[selected_method] = SentimentAnalyzer(method=selected_method)
             
             # Check what method was actually initialized (may have fallen back)
             actual_method = getattr(self.analyzer, 'method', selected_method)
@@ -450,7 +551,17 @@ class SentimentDashboardTab(QWidget):
                 if reply == QMessageBox.StandardButton.No:
                     return
             
+            # Reuse a stored result for the same conversations and method
+            self._result_cache_file = self._result_cache_path(self.analyzer)
+            cached_result = self._load_cached_result(self._result_cache_file)
+            if cached_result is not None:
+                self.current_sentiment = cached_result
+                self.display_results(cached_result)
+                self.show_completion_notice("✓ Loaded saved analysis")
+                return
+            
             # Show progress
+            self.progress_bar.show()
             self.progress_widget.show()
             self.analyze_btn.hide()
             self.stop_btn.show()
@@ -470,9 +581,8 @@ class SentimentDashboardTab(QWidget):
                 self.progress_label.setText(f"Analyzing {total_messages} messages...")
             
             # Start analysis in background thread
-            # For now, analyze first conversation (extend to multiple later)
             self.analysis_thread = SentimentAnalysisThread(
-                self.conversations[0], self.analyzer
+                self.conversations, self.analyzer
             )
             self.analysis_thread.progressUpdate.connect(self.update_progress)
             self.analysis_thread.analysisComplete.connect(self.on_analysis_complete)
@@ -505,6 +615,79 @@ class SentimentDashboardTab(QWidget):
         self.current_sentiment = sentiment_result
         self.display_results(sentiment_result)
         self.reset_ui()
+        self.show_completion_notice("✓ Analysis complete")
+        
+        if self._result_cache_file is not None:
+            self._save_cached_result(self._result_cache_file, sentiment_result)
+    
+    def _result_cache_path(self, analyzer: SentimentAnalyzer) -> Path:
+        """Get the disk cache file for analyzing the loaded conversations with an analyzer's settings"""
+        key = hashlib.sha256(f"{SENTIMENT_CACHE_VERSION}|{analyzer.method}|{analyzer.enable_advanced}".encode())
+        for conv in self.conversations:
+            last_timestamp = conv.messages[-1].timestamp.isoformat() if conv.messages else ""
+            key.update(f"|{conv.id}|{len(conv.messages)}|{last_timestamp}".encode())
+        return SENTIMENT_CACHE_DIR / f"{key.hexdigest()}.pkl"
+    
+    def _load_cached_result(self, cache_file: Path) -> Optional[ConversationSentiment]:
+        """Rebuild a stored analysis of the loaded conversations, if there is one"""
+        try:
+            if cache_file.exists():
+                with open(cache_file, 'rb') as f:
+                    stored = pickle.load(f)
+                if stored['version'] != SENTIMENT_CACHE_VERSION or len(stored['conversations']) != len(self.conversations):
+                    return None
+                
+                scores = []
+                for conv, (message_ids, values, methods, codes) in zip(self.conversations, stored['conversations']):
+                    if message_ids != [message.id for message in conv.messages]:
+                        return None
+                    scores.append([
+                        SentimentScore(*row, method=methods[code])
+                        for row, code in zip(values.tolist(), codes.tolist())
+                    ])
+                
+                # Recently used files are evicted last
+                cache_file.touch()
+                return self.analyzer.analyze_conversations_from_scores(self.conversations, scores)
+        except Exception as e:
+            print(f"Error loading cached sentiment analysis: {e}")
+        return None
+    
+    def _save_cached_result(self, cache_file: Path, sentiment_result: ConversationSentiment) -> bool:
+        """Store the per-message scores of an analysis for later runs"""
+        message_sentiments = sentiment_result.message_sentiments
+        if len(message_sentiments) != sum(len(conv.messages) for conv in self.conversations):
+            return False
+        
+        # Per conversation: message ids, a score matrix and method names by code
+        entries = []
+        offset = 0
+        for conv in self.conversations:
+            pairs = message_sentiments[offset:offset + len(conv.messages)]
+            offset += len(conv.messages)
+            values = np.array(
+                [(s.compound, s.positive, s.negative, s.neutral, s.confidence) for _, s in pairs],
+                dtype=np.float64
+            ).reshape(-1, 5)
+            methods, codes = np.unique(np.array([s.method for _, s in pairs], dtype=str), return_inverse=True)
+            entries.append(([message.id for message, _ in pairs], values, methods.tolist(), codes.astype(np.int8)))
+        
+        try:
+            cache_file.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_file, 'wb') as f:
+                pickle.dump({'version': SENTIMENT_CACHE_VERSION, 'conversations': entries},
+                            f, protocol=pickle.HIGHEST_PROTOCOL)
+            self._evict_cached_results()
+            return True
+        except Exception as e:
+            print(f"Error saving cached sentiment analysis: {e}")
+            return False
+    
+    def _evict_cached_results(self):
+        """Delete the least recently used stored analyses beyond SENTIMENT_CACHE_MAX_FILES"""
+        cache_files = sorted(SENTIMENT_CACHE_DIR.glob('*.pkl'), key=lambda path: path.stat().st_mtime, reverse=True)
+        for cache_file in cache_files[SENTIMENT_CACHE_MAX_FILES:]:
+            cache_file.unlink(missing_ok=True)
     
     @pyqtSlot(str)
     def on_analysis_error(self, error_msg: str):
@@ -519,6 +702,20 @@ class SentimentDashboardTab(QWidget):
         self.stop_btn.hide()
         self.progress_bar.setValue(0)
     
+    def show_completion_notice(self, message: str):
+        """Briefly show a non-blocking status message under the configuration"""
+        self.progress_bar.hide()
+        self.progress_label.setText(message)
+        self.progress_widget.show()
+        self._notice_timer.start()
+    
+    def _hide_completion_notice(self):
+        """Hide the completion notice unless a new analysis has started"""
+        if self.analysis_thread is not None and self.analysis_thread.isRunning():
+            return
+        self.progress_widget.hide()
+        self.progress_bar.show()
+    
     def display_results(self, sentiment: ConversationSentiment):
         """Display sentiment analysis results"""
         # Update overall sentiment card
@@ -531,17 +728,14 @@ class SentimentDashboardTab(QWidget):
         self.update_distribution_chart(sentiment.message_sentiments)
         
         # Update sender sentiment chart
-        self.update_sender_chart(sentiment.sentiment_by_sender)
-        
-        # Update summary
-        self.summary_text.setPlainText(sentiment.summary)
+        self.update_sender_chart(sentiment.sentiment_by_sender, sentiment.sender_display_names)
         
-        # Add keywords
+        # Update summary and keywords with a single document update
+        summary_parts = [sentiment.summary]
         if sentiment.keywords:
-            keywords_text = "\n\nTop Keywords:\n"
-            for word, count in sentiment.keywords[:10]:
-                keywords_text += f"• {word}: {count} occurrences\n"
-            self.summary_text.append(keywords_text)
+            summary_parts.append("\n\n\nTop Keywords:\n")
+            summary_parts.extend(f"• {word}: {count} occurrences\n" for word, count in sentiment.keywords[:10])
+        self.summary_text.setPlainText("".join(summary_parts))
         
         # Update emotional peaks
         self.update_emotional_peaks(sentiment.emotional_peaks)
@@ -552,26 +746,9 @@ class SentimentDashboardTab(QWidget):
     def update_sentiment_card(self, sentiment: SentimentScore):
         """Update the overall sentiment display card"""
         # Determine color and description based on score
-        if sentiment.compound > 0.5:
-            color = "#44ff44"
-            description = "Very Positive"
-            emoji = "😊"
-        elif sentiment.compound > 0.1:
-            color = "#88ff88"
-            description = "Positive"
-            emoji = "🙂"
-        elif sentiment.compound < -0.5:
-            color = "#ff4444"
-            description = "Very Negative"
-            emoji = "😔"
-        elif sentiment.compound < -0.1:
-            color = "#ff8888"
-            description = "Negative"
-            emoji = "😐"
-        else:
-            color = "#ffff88"
-            description = "Neutral"
-            emoji = "😶"
+        compound = sentiment.compound
+        intensity = bisect_left(self._CARD_EDGES, abs(compound))
+        color, description, emoji = self._CARD_STYLES[2 + intensity if compound > 0 else 2 - intensity]
         
         self.sentiment_value_label.setText(f"{emoji} {sentiment.compound:.2f}")
         self.sentiment_value_label.setStyleSheet(f"font-size: 24pt; font-weight: bold; color: {color};")
@@ -584,28 +761,29 @@ class SentimentDashboardTab(QWidget):
         if not timeline:
             return
         
-        # Group by time periods for better visualization
-        chart_data = []
-        for i, (timestamp, score) in enumerate(timeline):
-            # Use message index for x-axis, actual score for y-axis
-            chart_data.append((str(i+1), score))
+        scores = np.fromiter((score for _, score in timeline), dtype=np.float64, count=len(timeline))
         
-        # Limit to 50 points for readability
-        if len(chart_data) > 50:
-            step = len(chart_data) // 50
-            chart_data = chart_data[::step]
+        # Limit to 50 points for readability, keeping the peaks and troughs
+        indices = _lttb_indices(scores, TIMELINE_MAX_POINTS)
         
-        self.timeline_chart.set_data(chart_data, "Sentiment Over Time", "Message", "Sentiment")
+        # Use message index for x-axis, actual score for y-axis
+        self.timeline_chart.set_data_arrays(
+            (indices + 1).astype(str).tolist(), scores[indices],
+            "Sentiment Over Time", "Message", "Sentiment"
+        )
     
     def update_distribution_chart(self, message_sentiments: List[tuple[Message, SentimentScore]]):
         """Update sentiment distribution pie chart"""
         if not message_sentiments:
             return
         
-        # Count sentiments
-        positive = sum(1 for _, s in message_sentiments if s.compound > 0.1)
-        negative = sum(1 for _, s in message_sentiments if s.compound < -0.1)
-        neutral = len(message_sentiments) - positive - negative
+        # Count sentiments in one vectorized pass over the compound scores
+        compounds = np.fromiter(
+            (s.compound for _, s in message_sentiments), dtype=np.float64, count=len(message_sentiments)
+        )
+        positive = int((compounds > 0.1).sum())
+        negative = int((compounds < -0.1).sum())
+        neutral = len(compounds) - positive - negative
         
         chart_data = [
             ("Positive", positive),
@@ -615,19 +793,21 @@ class SentimentDashboardTab(QWidget):
         
         self.distribution_chart.set_data(chart_data, "Message Sentiment Distribution")
     
-    def update_sender_chart(self, sender_sentiments: Dict[str, SentimentScore]):
+    def update_sender_chart(self, sender_sentiments: Dict[str, SentimentScore],
+                            display_names: Optional[Dict[str, str]] = None):
         """Update per-sender sentiment chart"""
         if not sender_sentiments:
             return
         
-        chart_data = []
-        for sender, sentiment in sender_sentiments.items():
-            # Truncate long sender names
-            display_name = sender[:20] + "..." if len(sender) > 20 else sender
-            chart_data.append((display_name, sentiment.compound))
+        # Long sender names are truncated once by the analyzer
+        display_names = display_names or {}
+        chart_data = [
+            (display_names.get(sender, sender), sentiment.compound)
+            for sender, sentiment in sender_sentiments.items()
+        ]
         
         # Sort by sentiment score
-        chart_data.sort(key=lambda x: x[1], reverse=True)
+        chart_data.sort(key=itemgetter(1), reverse=True)
         
         self.sender_chart.set_data(chart_data, "Average Sentiment by Participant", 
                                   "Participant", "Sentiment Score")
@@ -638,20 +818,23 @@ class SentimentDashboardTab(QWidget):
             self.peaks_text.setPlainText("No significant emotional peaks detected.")
             return
         
-        peaks_text = "Most Emotionally Charged Messages:\n\n"
+        peaks_parts = ["Most Emotionally Charged Messages:\n\n"]
         
-        for i, (message, sentiment) in enumerate(peaks[:5], 1):
+        # The analyzer already selects and orders the top peaks
+        for i, (message, sentiment) in enumerate(peaks, 1):
             # Determine if positive or negative
             emotion = "Positive" if sentiment.compound > 0 else "Negative"
             
             # Truncate message text
             text_preview = message.text[:100] + "..." if len(message.text) > 100 else message.text
             
-            peaks_text += f"{i}. [{emotion} - Score: {sentiment.compound:.2f}]\n"
-            peaks_text += f"   {text_preview}\n"
-            peaks_text += f"   - {message.sender_id} at {message.timestamp.strftime('%Y-%m-%d %H:%M')}\n\n"
+            peaks_parts.append(
+                f"{i}. [{emotion} - Score: {sentiment.compound:.2f}]\n"
+                f"   {text_preview}\n"
+                f"   - {message.sender_id} at {message.timestamp.replace(tzinfo=None).isoformat(' ', 'minutes')}\n\n"
+            )
         
-        self.peaks_text.setPlainText(peaks_text)
+        self.peaks_text.setPlainText("".join(peaks_parts))
     
     def get_sentiment_data(self) -> Optional[Any]:
         """Get the current sentiment analysis data"""
@@ -24,11 +24,17 @@ including temporal pa        # Create stats object
         )vior, and response analytics.
 """
 
-from typing import Dict, List, Tuple, Optional, Any
-from datetime import datetime, timedelta
-from collections import defaultdict, Counter
+import os
+from typing import Dict, List, Tuple, Optional, Any, Callable, Iterable, Iterator
+from datetime import datetime, timedelta, timezone
+from collections import Counter
 import re
-from dataclasses import dataclass
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, replace
+from functools import lru_cache
+from itertools import chain, islice
+
+import numpy as np
 
 from parsers.base_parser import Conversation, Message
 
@@ -46,8 +52,77 @@ except ImportError:
         ConversationSentiment = Any
         SentimentScore = Any
 
+# Maximum number of distinct message texts whose cleaned length is cached
+CLEAN_LENGTH_CACHE_SIZE = 100_000
+
+# Below this many messages to convert, cleaning texts in a process pool costs
+# more in worker startup and pickling than it saves
+PARALLEL_MIN_MESSAGES = 200_000
+
+# Work items per pool worker, so unevenly sized chunks still balance out
+PARALLEL_CHUNKS_PER_WORKER = 4
+
+# Messages cleaned in-process between progress reports, so a long
+# conversation can still be abandoned part way through
+CLEAN_PROGRESS_CHUNK = 20_000
+
+# Gaps between messages of 30 days or more are not counted as responses
+RESPONSE_THRESHOLD_MINUTES = 43200
+
+# Timestamps are handled as integer microseconds since the epoch
+_US_PER_HOUR = 3600 * 1_000_000
+_US_PER_DAY = 24 * _US_PER_HOUR
+
+# 1970-01-01 was a Thursday (Monday is 0, as in datetime.weekday())
+_EPOCH_WEEKDAY = 3
+_EPOCH = datetime(1970, 1, 1)
+_EPOCH_UTC = _EPOCH.replace(tzinfo=timezone.utc)
+_ONE_US = timedelta(microseconds=1)
+
+# Hour and day names indexed like messages_by_hour and messages_by_day_of_week,
+# shared by the activity pattern getters, the dashboard and the exporter
+HOUR_LABELS = tuple(f"{hour:02d}:00" for hour in range(24))
+HOUR_NAMES = tuple(f"{hour % 12 or 12}{'AM' if hour < 12 else 'PM'}" for hour in range(24))
+DAY_NAMES = ('Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday')
+DAY_ABBREVIATIONS = tuple(name[:3] for name in DAY_NAMES)
+
+# URLs are left out of message lengths. The '$-_' range already covers digits,
+# upper case letters, '%' and the URL punctuation, so one character class
+# matches them without any alternation to backtrack through.
+_URL_RE = re.compile(r'https?://[!$-_a-z]+')
+_WHITESPACE_RE = re.compile(r'\s+')
+
 
-@dataclass
+def _to_microseconds(timestamp: datetime) -> int:
+    """Absolute time of a datetime in microseconds since the epoch, as used for message instants"""
+    offset = timestamp.utcoffset()
+    if offset is not None:
+        timestamp = timestamp.replace(tzinfo=None) - offset
+    return (timestamp - _EPOCH) // _ONE_US
+
+
+def conversation_signature(conversation: Conversation) -> Tuple:
+    """
+    Identify a conversation's current contents for result caches
+    
+    Caches must keep a reference to the conversation so its id cannot be
+    reused while they hold the signature; appending messages changes it.
+    """
+    messages = conversation.messages
+    return (id(conversation), len(messages), messages[-1].timestamp if messages else None)
+
+
+class CalculationCancelled(Exception):
+    """Raised from a progress callback to abandon a calculation"""
+
+
+def _first_seen(values: np.ndarray) -> np.ndarray:
+    """Return the distinct values of an integer array in order of first appearance"""
+    uniques, first_index = np.unique(values, return_index=True)
+    return uniques[np.argsort(first_index)]
+
+
+@dataclass(slots=True)
 class MessageStats:
     """Container for all calculated statistics"""
     total_messages: int
@@ -69,21 +144,52 @@ class MessageStats:
     sentiment_enabled: bool = False
 
 
+@dataclass(slots=True)
+class _ConversationColumns:
+    """Per-message columns of one conversation, in timestamp order"""
+    conversation: Conversation
+    messages: List[Message]  # sorted by timestamp
+    local_times: np.ndarray  # wall-clock microseconds since the epoch
+    instants: np.ndarray  # absolute microseconds since the epoch
+    sender_codes: np.ndarray  # indexes into StatisticsCalculator._senders
+    lengths: np.ndarray  # cleaned text lengths
+
+
 class StatisticsCalculator:
     """Calculates comprehensive statistics from conversation data"""
     
     def __init__(self):
         self.conversations: List[Conversation] = []
         self.cached_stats: Optional[MessageStats] = None
-        self._cache_valid = False
+        self._stats_cache_valid = False
+        self._cached_window: Tuple[Optional[datetime], Optional[datetime]] = (None, None)
+        # Columns keyed by conversation signature: those of the conversations
+        # loaded now and of the ones loaded before them that were dropped, so
+        # switching back to an earlier selection converts nothing. The columns
+        # share one sender interning (sender id -> code, and code -> sender id).
+        self._columns: Dict[Tuple, _ConversationColumns] = {}
+        self._previous_columns: Dict[Tuple, _ConversationColumns] = {}
+        self._sender_index: Dict[str, int] = {}
+        self._senders: List[str] = []
+        # Sentiment results are cached separately, per analyzer, since they do
+        # not depend on the date window
+        self._sentiment_cache_valid = False
+        self._sentiment_data: Optional[ConversationSentiment] = None
+        self._sentiment_analyzer = None
+        # get_response_time_summary() result and the response_times it describes
+        self._response_summary: Dict[str, Dict[str, float]] = {}
+        self._response_summary_source: Optional[Dict[str, List[float]]] = None
     
     def set_conversations(self, conversations: List[Conversation]) -> None:
         """Set the conversations to analyze and invalidate cache"""
         self.conversations = conversations
-        self._cache_valid = False
+        self._stats_cache_valid = False
+        self._sentiment_cache_valid = False
         self.cached_stats = None
     
-    def calculate_stats(self, force_refresh: bool = False, include_sentiment: bool = False, sentiment_analyzer=None) -> MessageStats:
+    def calculate_stats(self, force_refresh: bool = False, include_sentiment: bool = False, sentiment_analyzer=None,
+                        start: Optional[datetime] = None, end: Optional[datetime] = None,
+                        progress_callback: Optional[Callable[[int, int], None]] = None) -> MessageStats:
         """
         Calculate comprehensive statistics from the loaded conversations
         
@@ -91,95 +197,117 @@ class StatisticsCalculator:
             force_refresh: If True, recalculate even if cache is valid
             include_sentiment: If True, include sentiment analysis in results
             sentiment_analyzer: SentimentAnalyzer instance to use for sentiment analysis
+            start: If given, only count messages sent at or after this time
+            end: If given, only count messages sent before this time
+            progress_callback: Called with (work done, total work) while
+                newly loaded conversations are cleaned and converted, then
+                between the aggregation stages and during sentiment analysis;
+                raising CalculationCancelled from it abandons the calculation
             
         Returns:
             MessageStats object containing all calculated statistics
         """
-        if self._cache_valid and not force_refresh and not include_sentiment and self.cached_stats:
-            return self.cached_stats
+        window = (start, end)
+        if not (self._stats_cache_valid and not force_refresh and self.cached_stats and window == self._cached_window):
+            if not self.conversations:
+                return self._empty_stats()
+            
+            # Cache the results
+            self.cached_stats = self._aggregate(start, end, progress_callback)
+            self._stats_cache_valid = True
+            self._cached_window = window
         
-        if not self.conversations:
-            return self._empty_stats()
+        # Sentiment is analyzed and cached on its own and only attached here,
+        # so the common path never touches the analyzer
+        if include_sentiment:
+            sentiment_data = self._analyze_sentiment(sentiment_analyzer, force_refresh, progress_callback)
+            self.cached_stats = replace(self.cached_stats, sentiment_data=sentiment_data, sentiment_enabled=True)
         
-        # Initialize counters
-        total_messages = 0
-        messages_per_sender = defaultdict(int)
-        messages_by_hour = defaultdict(int)
-        messages_by_day_of_week = defaultdict(int)
-        message_lengths = defaultdict(list)
-        response_times = defaultdict(list)
+        return self.cached_stats
+    
+    def _aggregate(self, start: Optional[datetime], end: Optional[datetime],
+                   progress_callback: Optional[Callable[[int, int], None]] = None) -> MessageStats:
+        """Aggregate message statistics over the loaded conversations, without sentiment"""
+        def checkpoint():
+            # Each stage below is one vectorised pass; the caller may stop between them
+            if progress_callback is not None:
+                progress_callback(1, 1)
         
-        all_timestamps = []
+        # Each conversation's messages within the window, found by binary search
+        # on its timestamp-sorted columns
+        start_us = _to_microseconds(start) if start is not None else None
+        end_us = _to_microseconds(end) if end is not None else None
+        spans = []
+        for c in self._conversation_columns(progress_callback):
+            lo = int(np.searchsorted(c.instants, start_us)) if start_us is not None else 0
+            hi = int(np.searchsorted(c.instants, end_us)) if end_us is not None else len(c.messages)
+            if lo < hi:
+                spans.append((c, slice(lo, hi)))
+        endpoints = [c.messages[i].timestamp for c, span in spans for i in (span.start, span.stop - 1)]
         
-        # Sentiment analysis data
-        sentiment_data = None
+        senders = self._senders
+        if spans:
+            local_times = np.concatenate([c.local_times[span] for c, span in spans])
+            instants = np.concatenate([c.instants[span] for c, span in spans])
+            sender_codes = np.concatenate([c.sender_codes[span] for c, span in spans])
+            lengths = np.concatenate([c.lengths[span] for c, span in spans])
+        else:
+            local_times = instants = lengths = np.zeros(0, dtype=np.int64)
+            sender_codes = np.zeros(0, dtype=np.int32)
+        total_messages = len(sender_codes)
+        checkpoint()
         
-        # Process each conversation
-        for conversation in self.conversations:
-            if not conversation.messages:
-                continue
-                
-            # Sort messages by timestamp for response time calculation
-            sorted_messages = sorted(conversation.messages, key=lambda m: m.timestamp)
-            
-            # Process sentiment analysis if requested
-            if include_sentiment and sentiment_analyzer and SENTIMENT_AVAILABLE:
-                try:
-                    sentiment_data = sentiment_analyzer.analyze_conversation(conversation)
-                except Exception as e:
-                    print(f"Warning: Sentiment analysis failed: {e}")
-                    sentiment_data = None
-            
-            # Process each message
-            for i, message in enumerate(sorted_messages):
-                total_messages += 1
-                messages_per_sender[message.sender_id] += 1
-                
-                # Time-based statistics
-                hour = message.timestamp.hour
-                day_of_week = message.timestamp.weekday()
-                messages_by_hour[hour] += 1
-                messages_by_day_of_week[day_of_week] += 1
-                all_timestamps.append(message.timestamp)
-                
-                # Message length statistics
-                clean_text = self._clean_text(message.text)
-                message_lengths[message.sender_id].append(len(clean_text))
-                
-                # Response time calculation
-                if i > 0:
-                    prev_message = sorted_messages[i - 1]
-                    if prev_message.sender_id != message.sender_id:
-                        # Different sender = response
-                        time_diff = message.timestamp - prev_message.timestamp
-                        response_minutes = time_diff.total_seconds() / 60
-                        
-                        # Count response times with more flexible thresholds
-                        # For social media/messaging apps, responses can happen over days or weeks
-                        if response_minutes < 43200:  # 30 days in minutes (more realistic for social platforms)
-                            response_times[message.sender_id].append(response_minutes)
-        
-        # Calculate averages and derived statistics
-        average_message_length = {}
-        for sender, lengths in message_lengths.items():
-            if lengths:
-                average_message_length[sender] = sum(lengths) / len(lengths)
+        # Time-based statistics, keyed in order of first appearance so ties in
+        # the extremes below resolve to the earliest hour/day seen
+        hours = local_times // _US_PER_HOUR % 24
+        days_of_week = (local_times // _US_PER_DAY + _EPOCH_WEEKDAY) % 7
+        hour_counts = np.bincount(hours, minlength=24)
+        day_counts = np.bincount(days_of_week, minlength=7)
+        messages_by_hour = Counter({int(h): int(hour_counts[h]) for h in _first_seen(hours)})
+        messages_by_day_of_week = Counter({int(d): int(day_counts[d]) for d in _first_seen(days_of_week)})
+        
+        # Message counts and length statistics per sender
+        sender_counts = np.bincount(sender_codes, minlength=len(senders))
+        length_sums = np.bincount(sender_codes, weights=lengths, minlength=len(senders))
+        average_lengths = length_sums / np.maximum(sender_counts, 1)
+        sender_order = _first_seen(sender_codes).tolist()
+        messages_per_sender = Counter({senders[code]: int(sender_counts[code]) for code in sender_order})
+        average_message_length = {senders[code]: float(average_lengths[code]) for code in sender_order}
+        checkpoint()
         
+        # Derived from the per-sender sums rather than another pass over all lengths
         overall_average_length = 0
-        if message_lengths:
-            all_lengths = [length for lengths in message_lengths.values() for length in lengths]
-            if all_lengths:
-                overall_average_length = sum(all_lengths) / len(all_lengths)
+        if total_messages:
+            overall_average_length = float(length_sums.sum()) / total_messages
         
+        # Response time calculation: a message from a different sender than the
+        # previous message of the same conversation is a response. Divided in
+        # two steps to match timedelta.total_seconds() / 60 exactly.
+        response_minutes = np.diff(instants) / 1e6 / 60
+        # For social media/messaging apps, responses can happen over days or weeks
+        is_response = (sender_codes[1:] != sender_codes[:-1]) & (response_minutes < RESPONSE_THRESHOLD_MINUTES)
+        conversation_starts = np.cumsum([span.stop - span.start for _, span in spans], dtype=np.intp)[:-1]
+        is_response[conversation_starts - 1] = False
+        responders = sender_codes[1:][is_response]
+        response_minutes = response_minutes[is_response]
+        
+        order = np.argsort(responders, kind='stable')
+        codes, group_starts = np.unique(responders[order], return_index=True)
+        groups = dict(zip(codes.tolist(), np.split(response_minutes[order], group_starts[1:])))
+        response_sums = np.bincount(responders, weights=response_minutes, minlength=len(senders))
+        response_counts = np.bincount(responders, minlength=len(senders))
+        
+        response_times = {}
         average_response_times = {}
-        for sender, times in response_times.items():
-            if times:
-                average_response_times[sender] = sum(times) / len(times)
+        for code in _first_seen(responders).tolist():
+            response_times[senders[code]] = groups[code].tolist()
+            average_response_times[senders[code]] = float(response_sums[code] / response_counts[code])
+        checkpoint()
         
-        # Find extremes
-        most_active_hour = max(messages_by_hour, key=messages_by_hour.get) if messages_by_hour else 0
-        most_active_day = max(messages_by_day_of_week, key=messages_by_day_of_week.get) if messages_by_day_of_week else 0
-        most_prolific_sender = max(messages_per_sender, key=messages_per_sender.get) if messages_per_sender else ""
+        # Find extremes (most_common picks the first-seen key on ties)
+        most_active_hour = messages_by_hour.most_common(1)[0][0] if messages_by_hour else 0
+        most_active_day = messages_by_day_of_week.most_common(1)[0][0] if messages_by_day_of_week else 0
+        most_prolific_sender = messages_per_sender.most_common(1)[0][0] if messages_per_sender else ""
         
         fastest_responder = ""
         if average_response_times:
@@ -187,47 +315,179 @@ class StatisticsCalculator:
         
         # Date range
         date_range = (None, None)
-        if all_timestamps:
-            date_range = (min(all_timestamps), max(all_timestamps))
+        if endpoints:
+            date_range = (min(endpoints), max(endpoints))
         
-        # Create stats object
-        stats = MessageStats(
+        return MessageStats(
             total_messages=total_messages,
-            messages_per_sender=dict(messages_per_sender),
-            messages_by_hour=dict(messages_by_hour),
-            messages_by_day_of_week=dict(messages_by_day_of_week),
+            messages_per_sender=messages_per_sender,
+            messages_by_hour=messages_by_hour,
+            messages_by_day_of_week=messages_by_day_of_week,
             average_message_length=average_message_length,
             overall_average_length=overall_average_length,
-            response_times=dict(response_times),
+            response_times=response_times,
             average_response_times=average_response_times,
             conversation_count=len(self.conversations),
             date_range=date_range,
             most_active_hour=most_active_hour,
             most_active_day=most_active_day,
             most_prolific_sender=most_prolific_sender,
-            fastest_responder=fastest_responder,
-            sentiment_data=sentiment_data,
-            sentiment_enabled=include_sentiment
+            fastest_responder=fastest_responder
         )
+    
+    def _analyze_sentiment(self, sentiment_analyzer, force_refresh: bool,
+                           progress_callback: Optional[Callable[[int, int], None]] = None
+                           ) -> Optional[ConversationSentiment]:
+        """Run sentiment analysis over the loaded conversations, reusing the last result of the same analyzer"""
+        if not (sentiment_analyzer and SENTIMENT_AVAILABLE):
+            return None
+        if self._sentiment_cache_valid and not force_refresh and sentiment_analyzer is self._sentiment_analyzer:
+            return self._sentiment_data
+        
+        sentiment_data = None
+        for conversation in self.conversations:
+            if not conversation.messages:
+                continue
+            try:
+                sentiment_data = sentiment_analyzer.analyze_conversation(
+                    conversation, progress_callback=progress_callback)
+            except CalculationCancelled:
+                raise
+            except Exception as e:
+                print(f"Warning: Sentiment analysis failed: {e}")
+                sentiment_data = None
+        
+        self._sentiment_data = sentiment_data
+        self._sentiment_analyzer = sentiment_analyzer
+        self._sentiment_cache_valid = True
+        return sentiment_data
+    
+    def _conversation_columns(self, progress_callback: Optional[Callable[[int, int], None]] = None
+                              ) -> List[_ConversationColumns]:
+        """Return columns for every loaded conversation, converting only those not seen recently"""
+        signatures = [conversation_signature(conversation) for conversation in self.conversations]
+        known = {**self._previous_columns, **self._columns}
+        
+        # Conversations are converted independently; only the text cleaning is
+        # CPU-bound enough to be worth spreading over processes
+        stale = {
+            signature: conversation
+            for signature, conversation in zip(signatures, self.conversations)
+            if signature not in known
+        }
+        total = sum(len(conversation.messages) for conversation in stale.values())
+        done = 0
+        cleaned = self._clean_lengths(list(stale.values()), progress_callback=progress_callback)
+        for (signature, conversation), lengths in zip(stale.items(), cleaned):
+            known[signature] = self._to_columns(conversation, lengths)
+            if progress_callback is not None:
+                done += len(conversation.messages)
+                progress_callback(done, total)
         
-        # Cache the results
-        self.cached_stats = stats
-        self._cache_valid = True
+        current = {signature: known[signature] for signature in signatures}
+        self._previous_columns = {
+            signature: columns for signature, columns in self._columns.items() if signature not in current
+        }
+        self._columns = current
+        return [current[signature] for signature in signatures]
+    
+    def _clean_lengths(self, conversations: List[Conversation], workers: Optional[int] = None,
+                       progress_callback: Optional[Callable[[int, int], None]] = None) -> Iterable[np.ndarray]:
+        """
+        Compute cleaned text lengths for each conversation's messages
+        
+        Args:
+            conversations: Conversations to measure
+            workers: Number of worker processes (defaults to the CPU count)
+            progress_callback: Called with (items cleaned, items to clean)
+                after each chunk of messages, or of distinct texts in a pool
+            
+        Returns:
+            One array of lengths per conversation, in stored message order;
+            computed lazily, one conversation at a time, when done in-process
+        """
+        total = sum(len(conversation.messages) for conversation in conversations)
+        workers = workers or os.cpu_count() or 1
+        if total < PARALLEL_MIN_MESSAGES or workers < 2:
+            return self._clean_lengths_serial(conversations, total, progress_callback)
+        
+        # Only ship each distinct text to the workers once
+        texts = list(dict.fromkeys(message.text for conversation in conversations for message in conversation.messages))
+        chunk_size = -(-len(texts) // (workers * PARALLEL_CHUNKS_PER_WORKER))
+        chunks = [texts[i:i + chunk_size] for i in range(0, len(texts), chunk_size)]
+        lengths = []
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            # Leaving the loop early cancels the chunks that have not started yet
+            for chunk_lengths in pool.map(_clean_lengths_chunk, chunks):
+                lengths.extend(chunk_lengths)
+                if progress_callback is not None:
+                    progress_callback(len(lengths), len(texts))
+        cleaned = dict(zip(texts, lengths))
         
-        return stats
+        return [
+            np.fromiter((cleaned[message.text] for message in conversation.messages),
+                        dtype=np.int64, count=len(conversation.messages))
+            for conversation in conversations
+        ]
     
-    def _clean_text(self, text: str) -> str:
+    def _clean_lengths_serial(self, conversations: List[Conversation], total: int,
+                              progress_callback: Optional[Callable[[int, int], None]]) -> Iterator[np.ndarray]:
+        """Clean conversations in-process, one at a time, reporting after each chunk of messages"""
+        done = 0
+        for conversation in conversations:
+            messages = conversation.messages
+            lengths = np.empty(len(messages), dtype=np.int64)
+            for lo in range(0, len(messages), CLEAN_PROGRESS_CHUNK):
+                chunk = messages[lo:lo + CLEAN_PROGRESS_CHUNK]
+                lengths[lo:lo + len(chunk)] = np.fromiter((_clean_length(message.text) for message in chunk),
+                                                          dtype=np.int64, count=len(chunk))
+                if progress_callback is not None:
+                    done += len(chunk)
+                    progress_callback(done, total)
+            yield lengths
+    
+    def _to_columns(self, conversation: Conversation, lengths: np.ndarray) -> _ConversationColumns:
+        """Convert a conversation's messages and their cleaned lengths into parallel NumPy arrays in time order"""
+        messages = conversation.messages
+        # Integer microseconds straight from datetime arithmetic; this is several
+        # times faster than NumPy's datetime64 conversion of datetime objects
+        timestamps = [message.timestamp for message in messages]
+        count = len(timestamps)
+        if timestamps and timestamps[0].tzinfo is not None:
+            # Hours and weekdays follow the message's own clock, response
+            # times the actual elapsed time
+            local_times = np.fromiter(((t.replace(tzinfo=None) - _EPOCH) // _ONE_US for t in timestamps),
+                                      dtype=np.int64, count=count)
+            instants = np.fromiter(((t - _EPOCH_UTC) // _ONE_US for t in timestamps), dtype=np.int64, count=count)
+        else:
+            local_times = instants = np.fromiter(((t - _EPOCH) // _ONE_US for t in timestamps),
+                                                 dtype=np.int64, count=count)
+        
+        # Exported logs are almost always chronological already; only sort
+        # (stably, like sorted() by timestamp) when they are not
+        if (np.diff(instants) < 0).any():
+            order = np.argsort(instants, kind='stable')
+            messages = [messages[i] for i in order]
+            local_times = local_times[order]
+            instants = instants[order]
+            lengths = lengths[order]
+        
+        sender_index = self._sender_index
+        sender_codes = np.fromiter(
+            (sender_index.setdefault(message.sender_id, len(sender_index)) for message in messages),
+            dtype=np.int32, count=len(messages)
+        )
+        self._senders.extend(islice(sender_index, len(self._senders), None))
+        return _ConversationColumns(conversation, messages, local_times, instants, sender_codes, lengths)
+    
+    @staticmethod
+    def _clean_text(text: str) -> str:
         """Clean message text for length calculation"""
         if not text:
             return ""
         
-        # Remove URLs
-        text = re.sub(r'http[s]?://(?:[a-zA-Z]|[0-9]|[$-_@.&+]|[!*\\(\\),]|(?:%[0-9a-fA-F][0-9a-fA-F]))+', '', text)
-        
-        # Remove extra whitespace
-        text = re.sub(r'\s+', ' ', text.strip())
-        
-        return text
+        # Remove URLs, then extra whitespace
+        return _WHITESPACE_RE.sub(' ', _URL_RE.sub('', text).strip())
     
     def _empty_stats(self) -> MessageStats:
         """Return empty statistics when no data is available"""
@@ -255,27 +515,16 @@ class StatisticsCalculator:
         if not self.cached_stats:
             self.calculate_stats()
         
-        pattern = []
-        for hour in range(24):
-            count = self.cached_stats.messages_by_hour.get(hour, 0)
-            time_label = f"{hour:02d}:00"
-            pattern.append((time_label, count))
-        
-        return pattern
+        counts = self.cached_stats.messages_by_hour
+        return [(label, counts.get(hour, 0)) for hour, label in enumerate(HOUR_LABELS)]
     
     def get_weekly_activity_pattern(self) -> List[Tuple[str, int]]:
         """Get weekly activity pattern with day names"""
         if not self.cached_stats:
             self.calculate_stats()
         
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        pattern = []
-        
-        for day_num in range(7):
-            count = self.cached_stats.messages_by_day_of_week.get(day_num, 0)
-            pattern.append((day_names[day_num], count))
-        
-        return pattern
+        counts = self.cached_stats.messages_by_day_of_week
+        return [(name, counts.get(day_num, 0)) for day_num, name in enumerate(DAY_NAMES)]
     
     def get_top_senders(self, limit: int = 10) -> List[Tuple[str, int]]:
         """Get top message senders sorted by message count"""
@@ -295,15 +544,62 @@ class StatisticsCalculator:
         if not self.cached_stats:
             self.calculate_stats()
         
-        summary = {}
-        for sender, times in self.cached_stats.response_times.items():
-            if times:
-                summary[sender] = {
-                    'average': sum(times) / len(times),
-                    'median': sorted(times)[len(times) // 2],
-                    'min': min(times),
-                    'max': max(times),
-                    'count': len(times)
-                }
+        response_times = self.cached_stats.response_times
+        if response_times is self._response_summary_source:
+            return self._response_summary
         
+        summary = summarize_response_times(response_times, self.cached_stats.average_response_times)
+        
+        self._response_summary = summary
+        self._response_summary_source = response_times
         return summary
+
+
+def summarize_response_times(response_times: Dict[str, List[float]],
+                             average_response_times: Dict[str, float]) -> Dict[str, Dict[str, float]]:
+    """
+    Count, average, median, min and max response time for each sender
+    
+    The samples are laid out as one contiguous array with a start offset per
+    sender, so min and max come from a single segmented reduceat pass; the
+    median is the upper middle sample, selected per segment with np.partition.
+    """
+    senders = [sender for sender, times in response_times.items() if times]
+    if not senders:
+        return {}
+    
+    counts = np.fromiter((len(response_times[sender]) for sender in senders), dtype=np.intp, count=len(senders))
+    values = np.fromiter(chain.from_iterable(response_times[sender] for sender in senders),
+                         dtype=np.float64, count=int(counts.sum()))
+    starts = np.zeros(len(senders), dtype=np.intp)
+    np.cumsum(counts[:-1], out=starts[1:])
+    minimums = np.minimum.reduceat(values, starts)
+    maximums = np.maximum.reduceat(values, starts)
+    
+    summary = {}
+    for sender, start, count, minimum, maximum in zip(senders, starts.tolist(), counts.tolist(),
+                                                      minimums.tolist(), maximums.tolist()):
+        middle = count // 2
+        summary[sender] = {
+            'average': average_response_times[sender],
+            'median': float(np.partition(values[start:start + count], middle)[middle]),
+            'min': minimum,
+            'max': maximum,
+            'count': count
+        }
+    return summary
+
+
+@lru_cache(maxsize=CLEAN_LENGTH_CACHE_SIZE)
+def _clean_length(text: str) -> int:
+    """Length of a message text after StatisticsCalculator._clean_text
+    
+    Chat logs repeat short texts ("ok", reactions, stickers) a lot, and only
+    the length is needed, so it is cached per distinct text.
+    """
+    return len(StatisticsCalculator._clean_text(text))
+
+
+def _clean_lengths_chunk(texts: List[str]) -> List[int]:
+    """Cleaned lengths of a chunk of message texts (run in worker processes)"""
+    return [_clean_length(text) for text in texts]
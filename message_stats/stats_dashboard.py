@@ -6,41 +6,216 @@ Main dashboard widget for displaying comprehensive message statistics
 with charts and analytics in a modern, dark-themed interface.
 """
 
-from typing import List, Dict, Optional, Any
+from typing import List, Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
+from collections import deque
+from io import StringIO
+import time
+from heapq import nlargest
+from operator import itemgetter
 
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QLabel, 
     QPushButton, QFrame, QScrollArea, QGroupBox, QGridLayout,
     QSplitter, QTabWidget, QTextEdit, QSizePolicy, QSpacerItem,
-    QMessageBox, QFileDialog, QProgressBar
+    QMessageBox, QFileDialog, QProgressBar, QApplication
 )
-from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal, QThread, pyqtSlot, QObject, QCoreApplication
 from PyQt6.QtGui import QFont, QColor, QPalette, QPixmap, QIcon
 
 from parsers.base_parser import Conversation, Message
-from .stats_calculator import StatisticsCalculator, MessageStats
+from .stats_calculator import (
+    StatisticsCalculator, MessageStats, CalculationCancelled, conversation_signature, summarize_response_times,
+    HOUR_LABELS, HOUR_NAMES, DAY_NAMES, DAY_ABBREVIATIONS
+)
 from .chart_widgets import BarChart, PieChart, LineChart, ChartWidget
 from .stats_exporter import StatsExporter
 from .sentiment_dashboard_tab import SentimentDashboardTab
 
 
-class StatsCalculationThread(QThread):
-    """Background thread for calculating statistics"""
+# Number of recent conversation sets whose statistics are kept for refreshes
+STATS_CACHE_SIZE = 4
+
+# Quiet period after the last Refresh click before statistics are reloaded
+REFRESH_DEBOUNCE_MS = 150
+
+# How long closing the dashboard waits for an abandoned calculation to stop
+# before leaving its thread to finish in the background
+CALC_STOP_TIMEOUT_MS = 500
+
+# Minimum seconds between calculation progress signals sent to the UI thread (~10 Hz)
+PROGRESS_EMIT_INTERVAL = 1 / 10
+
+# Stylesheets are shared by every card and window instead of rebuilt per instance
+_STATCARD_FRAME_CSS = """
+    StatCard {
+        background-color: #2d2d2d;
+        border: 1px solid #404040;
+        border-radius: 8px;
+        padding: 10px;
+    }
+    StatCard:hover {
+        border-color: #007aff;
+    }
+"""
+_STATCARD_TITLE_CSS = "color: #999; font-size: 12px; font-weight: normal;"
+_STATCARD_VALUE_CSS = "color: #fff; font-size: 24px; font-weight: bold;"
+_STATCARD_SUBTITLE_CSS = "color: #bbb; font-size: 11px;"
+
+_PROGRESS_BAR_CSS = """
+    QProgressBar {
+        border: 1px solid #404040;
+        border-radius: 4px;
+        background-color: #2d2d2d;
+        text-align: center;
+    }
+    QProgressBar::chunk {
+        background-color: #007aff;
+        border-radius: 3px;
+    }
+"""
+
+_DASHBOARD_CSS = """
+    QMainWindow {
+        background-color: #1a1a1a;
+        color: #dcdcdc;
+    }
+    QTabWidget::pane {
+        border: 1px solid #404040;
+        background-color: #2d2d2d;
+    }
+    QTabWidget::tab-bar {
+        alignment: center;
+    }
+    QTabBar::tab {
+        background-color: #3d3d3d;
+        color: #dcdcdc;
+        padding: 8px 20px;
+        margin-right: 2px;
+        border-top-left-radius: 4px;
+        border-top-right-radius: 4px;
+    }
+    QTabBar::tab:selected {
+        background-color: #007aff;
+        color: white;
+    }
+    QTabBar::tab:hover:!selected {
+        background-color: #4d4d4d;
+    }
+    QGroupBox {
+        font-weight: bold;
+        border: 2px solid #404040;
+        border-radius: 8px;
+        margin-top: 1ex;
+        padding-top: 10px;
+    }
+    QGroupBox::title {
+        subcontrol-origin: margin;
+        left: 10px;
+        padding: 0 5px 0 5px;
+        color: #dcdcdc;
+    }
+    QPushButton {
+        background-color: #007aff;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+        font-weight: bold;
+    }
+    QPushButton:hover {
+        background-color: #0056b3;
+    }
+    QPushButton:pressed {
+        background-color: #004085;
+    }
+    QScrollArea {
+        border: none;
+        background-color: #1a1a1a;
+    }
+    QLabel {
+        color: #dcdcdc;
+    }
+"""
+
+
+# Calculation threads that were still busy when their dashboard stopped them,
+# kept referenced until they finish
+_retired_calc_threads: List[Tuple[QThread, QObject]] = []
+
+
+def _wait_for_retired_calc_threads():
+    """Block until every retired calculation thread has finished"""
+    for thread, _ in _retired_calc_threads:
+        thread.wait()
+    _retired_calc_threads.clear()
+
+
+class StatsWorker(QObject):
+    """Calculates statistics on the dashboard's long-lived background thread
     
+    The worker and its calculator outlive individual refreshes, so the
+    calculator's per-conversation column cache carries over between them.
+    """
+    
+    progressUpdate = pyqtSignal(int)  # progress percentage
     statsCalculated = pyqtSignal(object)  # MessageStats
     errorOccurred = pyqtSignal(str)
     
-    def __init__(self, conversations: List[Conversation]):
+    def __init__(self):
         super().__init__()
-        self.conversations = conversations
         self.calculator = StatisticsCalculator()
+        self.should_stop = False
+        self._last_emit = 0.0
+        self._last_percent = 0
     
-    def run(self):
+    @pyqtSlot(object)
+    def calculate(self, conversations: List[Conversation]):
+        self._last_emit = 0.0
+        self._last_percent = 0
         try:
-            self.calculator.set_conversations(self.conversations)
-            stats = self.calculator.calculate_stats()
+            self.calculator.set_conversations(conversations)
+            stats = self.calculator.calculate_stats(progress_callback=self._on_progress)
             self.statsCalculated.emit(stats)
+        except CalculationCancelled:
+            pass
+        except Exception as e:
+            self.errorOccurred.emit(str(e))
+    
+    def _on_progress(self, done: int, total: int):
+        """Report calculation progress and stop early when requested"""
+        if self.should_stop:
+            raise CalculationCancelled()
+        
+        # Keep the last percent for the aggregation that follows conversion, and
+        # coalesce updates so the UI thread is not flooded with queued signals
+        percent = min(99, done * 100 // total) if total else 99
+        now = time.monotonic()
+        if percent <= self._last_percent or now - self._last_emit < PROGRESS_EMIT_INTERVAL:
+            return
+        self._last_emit = now
+        self._last_percent = percent
+        self.progressUpdate.emit(percent)
+    
+    def stop(self):
+        self.should_stop = True
+
+
+class ExportWorker(QObject):
+    """Writes PDF reports on the dashboard's export thread"""
+    
+    exportFinished = pyqtSignal(str)  # file path
+    errorOccurred = pyqtSignal(str)
+    
+    def __init__(self, exporter: StatsExporter):
+        super().__init__()
+        self.exporter = exporter
+    
+    @pyqtSlot(object, str)
+    def export_pdf(self, stats: MessageStats, file_path: str):
+        try:
+            self.exporter.export_to_pdf(stats, file_path)
+            self.exportFinished.emit(file_path)
         except Exception as e:
             self.errorOccurred.emit(str(e))
 
@@ -51,36 +226,26 @@ class StatCard(QFrame):
     def __init__(self, title: str, value: str, subtitle: str = "", parent=None):
         super().__init__(parent)
         self.setFrameStyle(QFrame.Shape.Box)
-        self.setStyleSheet("""
-            StatCard {
-                background-color: #2d2d2d;
-                border: 1px solid #404040;
-                border-radius: 8px;
-                padding: 10px;
-            }
-            StatCard:hover {
-                border-color: #007aff;
-            }
-        """)
+        self.setStyleSheet(_STATCARD_FRAME_CSS)
         
         layout = QVBoxLayout(self)
         layout.setContentsMargins(15, 15, 15, 15)
         
         # Title
         self.title_label = QLabel(title)
-        self.title_label.setStyleSheet("color: #999; font-size: 12px; font-weight: normal;")
+        self.title_label.setStyleSheet(_STATCARD_TITLE_CSS)
         layout.addWidget(self.title_label)
         
         # Value (store reference for easy updates)
         self.value_label = QLabel(value)
-        self.value_label.setStyleSheet("color: #fff; font-size: 24px; font-weight: bold;")
+        self.value_label.setStyleSheet(_STATCARD_VALUE_CSS)
         layout.addWidget(self.value_label)
         
         # Subtitle
         self.subtitle_label = None
         if subtitle:
             self.subtitle_label = QLabel(subtitle)
-            self.subtitle_label.setStyleSheet("color: #bbb; font-size: 11px;")
+            self.subtitle_label.setStyleSheet(_STATCARD_SUBTITLE_CSS)
             layout.addWidget(self.subtitle_label)
         
         layout.addStretch()
@@ -97,8 +262,18 @@ class StatCard(QFrame):
         elif subtitle:
             # Create subtitle if it doesn't exist
             self.subtitle_label = QLabel(subtitle)
-            self.subtitle_label.setStyleSheet("color: #bbb; font-size: 11px;")
+            self.subtitle_label.setStyleSheet(_STATCARD_SUBTITLE_CSS)
             self.layout().insertWidget(-1, self.subtitle_label)  # Insert before stretch
+    
+    def update_all(self, value: str, subtitle: Optional[str] = None):
+        """Update the value and, if given, the subtitle in one repaint"""
+        self.setUpdatesEnabled(False)
+        try:
+            self.update_value(value)
+            if subtitle is not None:
+                self.update_subtitle(subtitle)
+        finally:
+            self.setUpdatesEnabled(True)
 
 
 class StatsDashboard(QMainWindow):
@@ -106,6 +281,8 @@ class StatsDashboard(QMainWindow):
     
     # Signals
     exportRequested = pyqtSignal(str)  # format
+    calculationRequested = pyqtSignal(object)  # List[Conversation]
+    pdfExportRequested = pyqtSignal(object, str)  # MessageStats, file path
     
     def __init__(self, conversations: List[Conversation] = None, parent=None):
         super().__init__(parent)
@@ -114,72 +291,54 @@ class StatsDashboard(QMainWindow):
         self.exporter = StatsExporter()
         self.stats: Optional[MessageStats] = None
         
+        # Sorted views of the current stats, rebuilt once per calculation
+        self._sorted_senders: List[Tuple[str, int]] = []
+        self._sorted_lengths: List[Tuple[str, float]] = []
+        self._sorted_response_times: List[Tuple[str, float]] = []
+        self._response_senders: List[str] = []
+        # Date range text shared by the overview card and the summary
+        self._date_range_str = "No data"
+        self._duration_days: Optional[int] = None
+        # Chart click details box, built on the first click and reused after
+        self._click_popup: Optional[QMessageBox] = None
+        
+        # Finished results keyed by the conversations' signatures (the value keeps
+        # the conversations alive so their ids stay unique), and the keys of
+        # requests still queued on the worker, in order
+        self._stats_cache: Dict[Tuple, Tuple[List[Conversation], MessageStats]] = {}
+        self._pending_calculations = deque()
+        
+        # Bursts of Refresh clicks collapse into one reload; a reload requested
+        # while a calculation is running waits for it to finish
+        self._refresh_timer = QTimer(self)
+        self._refresh_timer.setSingleShot(True)
+        self._refresh_timer.setInterval(REFRESH_DEBOUNCE_MS)
+        self._refresh_timer.timeout.connect(self._do_refresh)
+        self._refresh_dirty = False
+        
+        # Statistics are calculated by a worker living on one reusable thread;
+        # requests and results cross threads as queued signals
+        self.create_calc_worker()
+        
+        # PDF reports are written on a second thread so the window stays responsive
+        self.export_thread = QThread(self)
+        self.export_worker = ExportWorker(self.exporter)
+        self.export_worker.moveToThread(self.export_thread)
+        self.pdfExportRequested.connect(self.export_worker.export_pdf)
+        self.export_worker.exportFinished.connect(self.on_export_finished)
+        self.export_worker.errorOccurred.connect(self.on_export_error)
+        
+        app = QApplication.instance()
+        if app is not None:
+            app.aboutToQuit.connect(self.stop_calc_thread)
+            app.aboutToQuit.connect(self.stop_export_thread)
+            app.aboutToQuit.connect(_wait_for_retired_calc_threads)
+        
         self.setWindowTitle("Message Statistics Dashboard")
         self.setGeometry(100, 100, 1200, 800)
         
         # Apply dark theme
-        self.setStyleSheet("""
-            QMainWindow {
-                background-color: #1a1a1a;
-                color: #dcdcdc;
-            }
-            QTabWidget::pane {
-                border: 1px solid #404040;
-                background-color: #2d2d2d;
-            }
-            QTabWidget::tab-bar {
-                alignment: center;
-            }
-            QTabBar::tab {
-                background-color: #3d3d3d;
-                color: #dcdcdc;
-                padding: 8px 20px;
-                margin-right: 2px;
-                border-top-left-radius: 4px;
-                border-top-right-radius: 4px;
-            }
-            QTabBar::tab:selected {
-                background-color: #007aff;
-                color: white;
-            }
-            QTabBar::tab:hover:!selected {
-                background-color: #4d4d4d;
-            }
-            QGroupBox {
-                font-weight: bold;
-                border: 2px solid #404040;
-                border-radius: 8px;
-                margin-top: 1ex;
-                padding-top: 10px;
-            }
-            QGroupBox::title {
-                subcontrol-origin: margin;
-                left: 10px;
-                padding: 0 5px 0 5px;
-                color: #dcdcdc;
-            }
-            QPushButton {
-                background-color: #007aff;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-                font-weight: bold;
-            }
-            QPushButton:hover {
-                background-color: #0056b3;
-            }
-            QPushButton:pressed {
-                background-color: #004085;
-            }
-            QScrollArea {
-                border: none;
-                background-color: #1a1a1a;
-            }
-            QLabel {
-                color: #dcdcdc;
-            }
-        """)
+        self.setStyleSheet(_DASHBOARD_CSS)
         
         self.setup_ui()
         
@@ -201,20 +360,17 @@ class StatsDashboard(QMainWindow):
         # Progress bar (hidden by default)
         self.progress_bar = QProgressBar()
         self.progress_bar.setVisible(False)
-        self.progress_bar.setStyleSheet("""
-            QProgressBar {
-                border: 1px solid #404040;
-                border-radius: 4px;
-                background-color: #2d2d2d;
-                text-align: center;
-            }
-            QProgressBar::chunk {
-                background-color: #007aff;
-                border-radius: 3px;
-            }
-        """)
+        self.progress_bar.setStyleSheet(_PROGRESS_BAR_CSS)
         main_layout.addWidget(self.progress_bar)
         
+        # Busy indicator of a PDF export, separate from the calculation's bar
+        # since both can run at once
+        self.export_progress_bar = QProgressBar()
+        self.export_progress_bar.setVisible(False)
+        self.export_progress_bar.setRange(0, 0)  # Indeterminate progress
+        self.export_progress_bar.setStyleSheet(_PROGRESS_BAR_CSS)
+        main_layout.addWidget(self.export_progress_bar)
+        
         # Main content area with tabs
         self.setup_content_area(main_layout)
     
@@ -235,9 +391,9 @@ class StatsDashboard(QMainWindow):
         refresh_btn.clicked.connect(self.refresh_stats)
         header_layout.addWidget(refresh_btn)
         
-        export_btn = QPushButton("Export PDF")
-        export_btn.clicked.connect(self.export_pdf)
-        header_layout.addWidget(export_btn)
+        self.export_btn = QPushButton("Export PDF")
+        self.export_btn.clicked.connect(self.export_pdf)
+        header_layout.addWidget(self.export_btn)
         
         layout.addWidget(header_frame)
     
@@ -249,23 +405,54 @@ class StatsDashboard(QMainWindow):
         self.overview_tab = self.create_overview_tab()
         self.tab_widget.addTab(self.overview_tab, "Overview")
         
-        # Temporal patterns tab
-        self.temporal_tab = self.create_temporal_tab()
-        self.tab_widget.addTab(self.temporal_tab, "Time Patterns")
+        # The remaining tabs start as empty pages and are built the first time
+        # they are shown (see materialize_tab)
+        self.temporal_tab: Optional[QWidget] = None
+        self.users_tab: Optional[QWidget] = None
+        self.response_tab: Optional[QWidget] = None
+        self.sentiment_tab: Optional[SentimentDashboardTab] = None
+        self._tab_factories = {}
+        for title, factory in (("Time Patterns", self.build_temporal_tab),
+                               ("User Analytics", self.build_users_tab),
+                               ("Response Analysis", self.build_response_tab),
+                               ("Sentiment Analysis", self.build_sentiment_tab)):
+            page = QWidget()
+            QVBoxLayout(page).setContentsMargins(0, 0, 0, 0)
+            self._tab_factories[self.tab_widget.addTab(page, title)] = factory
+        self.tab_widget.currentChanged.connect(self.materialize_tab)
         
-        # User analytics tab
+        layout.addWidget(self.tab_widget)
+    
+    def materialize_tab(self, index: int):
+        """Build a tab's contents into its placeholder page on first display"""
+        factory = self._tab_factories.pop(index, None)
+        if factory is not None:
+            self.tab_widget.widget(index).layout().addWidget(factory())
+    
+    def build_temporal_tab(self) -> QWidget:
+        """Create the temporal patterns tab and fill it with the current statistics"""
+        self.temporal_tab = self.create_temporal_tab()
+        self.update_temporal_tab()
+        return self.temporal_tab
+    
+    def build_users_tab(self) -> QWidget:
+        """Create the user analytics tab and fill it with the current statistics"""
         self.users_tab = self.create_users_tab()
-        self.tab_widget.addTab(self.users_tab, "User Analytics")
-        
-        # Response analysis tab
+        self.update_users_tab()
+        return self.users_tab
+    
+    def build_response_tab(self) -> QWidget:
+        """Create the response analysis tab and fill it with the current statistics"""
         self.response_tab = self.create_response_tab()
-        self.tab_widget.addTab(self.response_tab, "Response Analysis")
-        
-        # Sentiment analysis tab
+        self.update_response_tab()
+        return self.response_tab
+    
+    def build_sentiment_tab(self) -> QWidget:
+        """Create the sentiment analysis tab and hand it the loaded conversations"""
         self.sentiment_tab = SentimentDashboardTab()
-        self.tab_widget.addTab(self.sentiment_tab, "Sentiment Analysis")
-        
-        layout.addWidget(self.tab_widget)
+        if self.conversations:
+            self.sentiment_tab.load_conversations(self.conversations)
+        return self.sentiment_tab
     
     def create_overview_tab(self) -> QWidget:
         """Create the overview tab with key statistics"""
@@ -425,36 +612,87 @@ class StatsDashboard(QMainWindow):
     def load_conversations(self, conversations: List[Conversation]):
         """Load conversation data and calculate statistics"""
         self.conversations = conversations
-        self.progress_bar.setVisible(True)
-        self.progress_bar.setRange(0, 0)  # Indeterminate progress
         
-        # Load conversations into sentiment tab
-        self.sentiment_tab.load_conversations(conversations)
+        # Load conversations into sentiment tab (once it has been opened)
+        if self.sentiment_tab is not None:
+            self.sentiment_tab.load_conversations(conversations)
+        
+        # Unchanged conversations (e.g. a plain refresh) reuse their statistics
+        key = tuple(conversation_signature(conversation) for conversation in conversations)
+        cached = self._stats_cache.get(key)
+        if cached is not None:
+            self.show_stats(cached[1])
+            return
+        
+        self.progress_bar.setVisible(True)
+        self.progress_bar.setRange(0, 100)
+        self.progress_bar.setValue(0)
         
         # Calculate stats in background thread
-        self.calc_thread = StatsCalculationThread(conversations)
-        self.calc_thread.statsCalculated.connect(self.on_stats_calculated)
-        self.calc_thread.errorOccurred.connect(self.on_calc_error)
-        self.calc_thread.start()
+        if not self.calc_thread.isRunning():
+            self.calc_thread.start()
+        self._pending_calculations.append((key, conversations))
+        self.calculationRequested.emit(conversations)
+    
+    @pyqtSlot(int)
+    def on_calc_progress(self, percentage: int):
+        """Update the progress bar while statistics are calculated"""
+        self.progress_bar.setValue(percentage)
     
     @pyqtSlot(object)
     def on_stats_calculated(self, stats: MessageStats):
         """Handle completion of statistics calculation"""
+        if self._pending_calculations:
+            key, conversations = self._pending_calculations.popleft()
+            self._stats_cache[key] = (conversations, stats)
+            if len(self._stats_cache) > STATS_CACHE_SIZE:
+                del self._stats_cache[next(iter(self._stats_cache))]
+        
+        self.show_stats(stats)
+        self._refresh_if_dirty()
+    
+    def show_stats(self, stats: MessageStats):
+        """Display a finished set of statistics"""
         self.progress_bar.setVisible(False)
         self.stats = stats
+        self.cache_sorted_stats()
+        self.cache_date_range()
         self.update_all_displays()
     
+    def cache_sorted_stats(self):
+        """Sort the per-sender tables once so the tab updaters can slice them"""
+        by_value = itemgetter(1)
+        self._sorted_senders = nlargest(10, self.stats.messages_per_sender.items(), key=by_value)
+        self._sorted_lengths = nlargest(10, self.stats.average_message_length.items(), key=by_value)
+        self._sorted_response_times = sorted(self.stats.average_response_times.items(), key=by_value)
+        self._response_senders = sorted(self.stats.response_times)
+    
+    def cache_date_range(self):
+        """Format the date range and its length in days once per calculation"""
+        first, last = self.stats.date_range
+        if first and last:
+            self._date_range_str = f"{first:%Y-%m-%d} to {last:%Y-%m-%d}"
+            self._duration_days = (last - first).days
+        else:
+            self._date_range_str = "No data"
+            self._duration_days = None
+    
     @pyqtSlot(str)
     def on_calc_error(self, error_msg: str):
         """Handle calculation error"""
+        if self._pending_calculations:
+            self._pending_calculations.popleft()
         self.progress_bar.setVisible(False)
         QMessageBox.critical(self, "Calculation Error", f"Error calculating statistics:\n{error_msg}")
+        self._refresh_if_dirty()
     
     def update_all_displays(self):
         """Update all charts and displays with current statistics"""
         if not self.stats:
             return
         
+        # Suspend painting so the four tabs' chart and text updates land in one repaint
+        self.setUpdatesEnabled(False)
         try:
             self.update_overview_tab()
             self.update_temporal_tab()
@@ -462,99 +700,74 @@ class StatsDashboard(QMainWindow):
             self.update_response_tab()
         except Exception as e:
             QMessageBox.warning(self, "Display Error", f"Error updating displays:\n{str(e)}")
+        finally:
+            self.setUpdatesEnabled(True)
+            self.update()
     
     def update_overview_tab(self):
         """Update the overview tab with current statistics"""
         if not self.stats:
             return
         
-        # Update stat cards using the new methods
-        self.total_messages_card.update_value(f"{self.stats.total_messages:,}")
-        self.conversations_card.update_value(f"{self.stats.conversation_count:,}")
-        
-        # Date range
-        if self.stats.date_range[0] and self.stats.date_range[1]:
-            start_date = self.stats.date_range[0].strftime("%Y-%m-%d")
-            end_date = self.stats.date_range[1].strftime("%Y-%m-%d")
-            date_text = f"{start_date} to {end_date}"
-        else:
-            date_text = "No data"
-        
-        self.date_range_card.update_value(date_text)
-        self.avg_length_card.update_value(f"{self.stats.overall_average_length:.0f} chars")
+        # Update stat cards
+        self._batch_update_overview_cards(
+            total=f"{self.stats.total_messages:,}",
+            conversations=f"{self.stats.conversation_count:,}",
+            date_range=self._date_range_str,
+            average_length=f"{self.stats.overall_average_length:.0f} chars"
+        )
         
         # Update summary text
         summary = self.generate_summary()
         self.summary_text.setPlainText(summary)
         
         # Update sender chart
-        sender_data = [(sender, count) for sender, count in 
-                       sorted(self.stats.messages_per_sender.items(), 
-                              key=lambda x: x[1], reverse=True)[:10]]
-        self.sender_chart.set_data(sender_data, "Top Message Senders", "Users", "Messages")
+        self.sender_chart.set_data(self._sorted_senders[:10], "Top Message Senders", "Users", "Messages")
+    
+    def _batch_update_overview_cards(self, *, total: str, conversations: str, date_range: str, average_length: str):
+        """Set the four overview card values behind a single repaint of the overview tab"""
+        self.overview_tab.setUpdatesEnabled(False)
+        try:
+            self.total_messages_card.update_all(total)
+            self.conversations_card.update_all(conversations)
+            self.date_range_card.update_all(date_range)
+            self.avg_length_card.update_all(average_length)
+        finally:
+            self.overview_tab.setUpdatesEnabled(True)
     
     def update_temporal_tab(self):
         """Update the temporal patterns tab"""
-        if not self.stats:
+        if not self.stats or self.temporal_tab is None:
             return
         
         # Hourly activity
-        hourly_data = []
-        for hour in range(24):
-            count = self.stats.messages_by_hour.get(hour, 0)
-            time_label = f"{hour:02d}:00"
-            hourly_data.append((time_label, count))
-        
-        self.hourly_chart.set_data(hourly_data, "Hourly Message Activity", "Hour", "Messages")
+        hourly_counts = self.stats.messages_by_hour
+        self.hourly_chart.set_data_arrays(HOUR_LABELS, [hourly_counts.get(hour, 0) for hour in range(24)],
+                                          "Hourly Message Activity", "Hour", "Messages")
         
         # Weekly activity
-        day_names = ['Mon', 'Tue', 'Wed', 'Thu', 'Fri', 'Sat', 'Sun']
-        weekly_data = []
-        for day in range(7):
-            count = self.stats.messages_by_day_of_week.get(day, 0)
-            weekly_data.append((day_names[day], count))
-        
-        self.weekly_chart.set_data(weekly_data, "Weekly Message Activity", "Day", "Messages")
+        weekly_counts = self.stats.messages_by_day_of_week
+        self.weekly_chart.set_data_arrays(DAY_ABBREVIATIONS, [weekly_counts.get(day, 0) for day in range(7)],
+                                          "Weekly Message Activity", "Day", "Messages")
     
     def update_users_tab(self):
         """Update the user analytics tab"""
-        if not self.stats:
+        if not self.stats or self.users_tab is None:
             return
         
         # Message distribution pie chart
-        pie_data = [(sender, count) for sender, count in 
-                    sorted(self.stats.messages_per_sender.items(), 
-                           key=lambda x: x[1], reverse=True)[:8]]
-        self.message_pie_chart.set_data(pie_data, "Message Distribution by User")
+        self.message_pie_chart.set_data(self._sorted_senders[:8], "Message Distribution by User")
         
         # Average message length
-        length_data = [(sender, length) for sender, length in 
-                       sorted(self.stats.average_message_length.items(), 
-                              key=lambda x: x[1], reverse=True)[:10]]
-        self.length_chart.set_data(length_data, "Average Message Length", "Users", "Characters")
+        self.length_chart.set_data(self._sorted_lengths[:10], "Average Message Length", "Users", "Characters")
     
     def update_response_tab(self):
         """Update the response analysis tab"""
-        if not self.stats:
+        if not self.stats or self.response_tab is None:
             return
         
         # Response times chart
-        response_data = []
-        for sender, avg_time in sorted(self.stats.average_response_times.items(), 
-                                      key=lambda x: x[1]):
-            # Convert minutes to more readable format
-            if avg_time < 60:
-                time_str = f"{avg_time:.1f}m"
-            elif avg_time < 1440:  # Less than a day
-                hours = avg_time / 60
-                time_str = f"{hours:.1f}h"
-            else:
-                days = avg_time / 1440
-                time_str = f"{days:.1f}d"
-            
-            response_data.append((sender, avg_time))
-        
-        self.response_chart.set_data(response_data, "Average Response Times", "Users", "Minutes")
+        self.response_chart.set_data(self._sorted_response_times, "Average Response Times", "Users", "Minutes")
         
         # Response details text
         details = self.generate_response_details()
@@ -565,30 +778,25 @@ class StatsDashboard(QMainWindow):
         if not self.stats:
             return "No data available."
         
-        summary_parts = []
+        summary = StringIO()
         
         # Basic stats
-        summary_parts.append(f"📊 CONVERSATION SUMMARY")
-        summary_parts.append(f"Total Messages: {self.stats.total_messages:,}")
-        summary_parts.append(f"Conversations: {self.stats.conversation_count:,}")
-        summary_parts.append(f"Average Message Length: {self.stats.overall_average_length:.0f} characters")
+        summary.write(f"📊 CONVERSATION SUMMARY\n"
+                      f"Total Messages: {self.stats.total_messages:,}\n"
+                      f"Conversations: {self.stats.conversation_count:,}\n"
+                      f"Average Message Length: {self.stats.overall_average_length:.0f} characters")
         
         # Date range
-        if self.stats.date_range[0] and self.stats.date_range[1]:
-            duration = self.stats.date_range[1] - self.stats.date_range[0]
-            summary_parts.append(f"Duration: {duration.days} days")
+        if self._duration_days is not None:
+            summary.write(f"\nDuration: {self._duration_days} days")
         
         # Most active
         if self.stats.most_prolific_sender:
-            summary_parts.append(f"Most Active User: {self.stats.most_prolific_sender}")
+            summary.write(f"\nMost Active User: {self.stats.most_prolific_sender}")
         
         # Time patterns
-        hour_names = ["12AM", "1AM", "2AM", "3AM", "4AM", "5AM", "6AM", "7AM", "8AM", "9AM", "10AM", "11AM",
-                     "12PM", "1PM", "2PM", "3PM", "4PM", "5PM", "6PM", "7PM", "8PM", "9PM", "10PM", "11PM"]
-        summary_parts.append(f"Most Active Hour: {hour_names[self.stats.most_active_hour]}")
-        
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        summary_parts.append(f"Most Active Day: {day_names[self.stats.most_active_day]}")
+        summary.write(f"\nMost Active Hour: {HOUR_NAMES[self.stats.most_active_hour]}"
+                      f"\nMost Active Day: {DAY_NAMES[self.stats.most_active_day]}")
         
         # Response times
         if self.stats.fastest_responder:
@@ -599,37 +807,34 @@ class StatsDashboard(QMainWindow):
                 time_str = f"{avg_time/60:.1f} hours"
             else:
                 time_str = f"{avg_time/1440:.1f} days"
-            summary_parts.append(f"Fastest Responder: {self.stats.fastest_responder} ({time_str})")
+            summary.write(f"\nFastest Responder: {self.stats.fastest_responder} ({time_str})")
         
-        return "\n".join(summary_parts)
+        return summary.getvalue()
     
     def generate_response_details(self) -> str:
         """Generate detailed response time analysis"""
         if not self.stats or not self.stats.response_times:
             return "No response time data available."
         
-        details = []
-        details.append("RESPONSE TIME ANALYSIS")
-        details.append("=" * 50)
+        details = StringIO()
+        details.write("RESPONSE TIME ANALYSIS\n")
+        details.write("=" * 50)
         
-        for sender in sorted(self.stats.response_times.keys()):
-            times = self.stats.response_times[sender]
-            if not times:
+        summary = summarize_response_times(self.stats.response_times, self.stats.average_response_times)
+        for sender in self._response_senders:
+            sender_summary = summary.get(sender)
+            if sender_summary is None:
                 continue
             
-            avg_time = sum(times) / len(times)
-            min_time = min(times)
-            max_time = max(times)
-            median_time = sorted(times)[len(times) // 2]
-            
-            details.append(f"\n{sender}:")
-            details.append(f"  Responses: {len(times)}")
-            details.append(f"  Average: {self.format_time(avg_time)}")
-            details.append(f"  Median:  {self.format_time(median_time)}")
-            details.append(f"  Fastest: {self.format_time(min_time)}")
-            details.append(f"  Slowest: {self.format_time(max_time)}")
-        
-        return "\n".join(details)
+            # One template per sender block rather than six separate lines
+            details.write(f"\n\n{sender}:\n"
+                          f"  Responses: {sender_summary['count']}\n"
+                          f"  Average: {self.format_time(sender_summary['average'])}\n"
+                          f"  Median:  {self.format_time(sender_summary['median'])}\n"
+                          f"  Fastest: {self.format_time(sender_summary['min'])}\n"
+                          f"  Slowest: {self.format_time(sender_summary['max'])}")
+        
+        return details.getvalue()
     
     def format_time(self, minutes: float) -> str:
         """Format time duration for display"""
@@ -643,10 +848,22 @@ class StatsDashboard(QMainWindow):
             return f"{minutes/1440:.1f}d"
     
     def refresh_stats(self):
-        """Refresh statistics calculation"""
-        if self.conversations:
+        """Refresh statistics calculation (restarts the debounce timer)"""
+        self._refresh_timer.start()
+    
+    def _do_refresh(self):
+        """Reload statistics once the Refresh clicks have settled"""
+        if self._pending_calculations:
+            self._refresh_dirty = True
+        elif self.conversations:
             self.load_conversations(self.conversations)
     
+    def _refresh_if_dirty(self):
+        """Run a refresh that was deferred while calculations were queued"""
+        if self._refresh_dirty and not self._pending_calculations:
+            self._refresh_dirty = False
+            self._do_refresh()
+    
     def export_pdf(self):
         """Export statistics to PDF"""
         if not self.stats:
@@ -657,7 +874,7 @@ class StatsDashboard(QMainWindow):
         include_sentiment = False
         sentiment_data = None
         
-        if hasattr(self, 'sentiment_tab') and self.sentiment_tab.current_sentiment:
+        if self.sentiment_tab is not None and self.sentiment_tab.current_sentiment:
             reply = QMessageBox.question(
                 self, "Include Sentiment Analysis", 
                 "Include sentiment analysis in the PDF report?",
@@ -685,32 +902,102 @@ class StatsDashboard(QMainWindow):
         )
         
         if file_path:
-            try:
-                # Create a new stats object with sentiment data if needed
-                export_stats = self.stats
-                if include_sentiment and sentiment_data:
-                    # Create a copy of stats with sentiment data
-                    from dataclasses import replace
-                    export_stats = replace(
-                        self.stats,
-                        sentiment_data=sentiment_data,
-                        sentiment_enabled=True
-                    )
-                
-                self.exporter.export_to_pdf(export_stats, file_path)
-                QMessageBox.information(self, "Export Complete", f"Statistics exported to:\n{file_path}")
-            except Exception as e:
-                QMessageBox.critical(self, "Export Error", f"Error exporting PDF:\n{str(e)}")
+            # Create a new stats object with sentiment data if needed
+            export_stats = self.stats
+            if include_sentiment and sentiment_data:
+                # Create a copy of stats with sentiment data
+                from dataclasses import replace
+                export_stats = replace(
+                    self.stats,
+                    sentiment_data=sentiment_data,
+                    sentiment_enabled=True
+                )
+            
+            # Write the report in the background; one export at a time
+            self.export_btn.setEnabled(False)
+            self.export_progress_bar.setVisible(True)
+            if not self.export_thread.isRunning():
+                self.export_thread.start()
+            self.pdfExportRequested.emit(export_stats, file_path)
+    
+    @pyqtSlot(str)
+    def on_export_finished(self, file_path: str):
+        """Handle completion of a PDF export"""
+        self.export_btn.setEnabled(True)
+        self.export_progress_bar.setVisible(False)
+        QMessageBox.information(self, "Export Complete", f"Statistics exported to:\n{file_path}")
+    
+    @pyqtSlot(str)
+    def on_export_error(self, error_msg: str):
+        """Handle PDF export error"""
+        self.export_btn.setEnabled(True)
+        self.export_progress_bar.setVisible(False)
+        QMessageBox.critical(self, "Export Error", f"Error exporting PDF:\n{error_msg}")
     
     def on_chart_clicked(self, label: str, value):
         """Handle chart data point clicks"""
-        QMessageBox.information(self, "Chart Data", f"Label: {label}\nValue: {value}")
+        # One non-modal box shows the latest click, so rapid clicks never stack
+        if self._click_popup is None:
+            self._click_popup = QMessageBox(QMessageBox.Icon.Information, "Chart Data", "",
+                                            QMessageBox.StandardButton.Ok, self)
+            self._click_popup.setModal(False)
+        self._click_popup.setText(f"Label: {label}\nValue: {value}")
+        self._click_popup.show()
+        self._click_popup.raise_()
+        self._click_popup.activateWindow()
     
     def closeEvent(self, event):
         """Handle window close event"""
         # Clean up any running threads
-        if hasattr(self, 'calc_thread') and self.calc_thread.isRunning():
-            self.calc_thread.terminate()
-            self.calc_thread.wait()
+        self.stop_calc_thread()
+        self.stop_export_thread()
         
         event.accept()
+    
+    def create_calc_worker(self):
+        """Create the calculation thread and its worker and connect their signals"""
+        self.calc_thread = QThread(self)
+        self.calc_worker = StatsWorker()
+        self.calc_worker.moveToThread(self.calc_thread)
+        self.calculationRequested.connect(self.calc_worker.calculate)
+        self.calc_worker.progressUpdate.connect(self.on_calc_progress)
+        self.calc_worker.statsCalculated.connect(self.on_stats_calculated)
+        self.calc_worker.errorOccurred.connect(self.on_calc_error)
+    
+    def stop_calc_thread(self):
+        """Stop the calculation thread, abandoning the calculation in progress
+        
+        The worker gives up at its next progress check; requests still queued
+        for it are dropped so a later restart does not replay them. A worker
+        that does not stop within CALC_STOP_TIMEOUT_MS is left to finish on its
+        own thread, cut off from the dashboard, and replaced by a fresh one.
+        """
+        if self.calc_thread.isRunning():
+            self.calc_worker.stop()
+            self.calc_thread.quit()
+            QCoreApplication.removePostedEvents(self.calc_worker)
+            if self.calc_thread.wait(CALC_STOP_TIMEOUT_MS):
+                self.calc_worker.should_stop = False
+            else:
+                self.retire_calc_thread()
+            self._pending_calculations.clear()
+            self._refresh_dirty = False
+            self.progress_bar.setVisible(False)
+    
+    def retire_calc_thread(self):
+        """Hand the busy calculation thread off to finish in the background"""
+        self.calculationRequested.disconnect(self.calc_worker.calculate)
+        self.calc_worker.blockSignals(True)
+        # Unparented so closing the dashboard does not destroy a running thread
+        self.calc_thread.setParent(None)
+        _retired_calc_threads[:] = [
+            (thread, worker) for thread, worker in _retired_calc_threads if not thread.isFinished()
+        ]
+        _retired_calc_threads.append((self.calc_thread, self.calc_worker))
+        self.create_calc_worker()
+    
+    def stop_export_thread(self):
+        """Stop the export thread, letting a report being written finish first"""
+        if self.export_thread.isRunning():
+            self.export_thread.quit()
+            self.export_thread.wait()
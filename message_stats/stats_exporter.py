@@ -21,7 +21,7 @@ from reportlab.lib.colors import Color, black, blue, gray
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 
-from .stats_calculator import MessageStats
+from .stats_calculator import MessageStats, HOUR_NAMES, DAY_NAMES
 
 
 class StatsExporter:
@@ -227,14 +227,10 @@ class StatsExporter:
         content.append(Paragraph("Temporal Patterns", self.heading_style))
         
         # Most active times
-        hour_names = ["12AM", "1AM", "2AM", "3AM", "4AM", "5AM", "6AM", "7AM", "8AM", "9AM", "10AM", "11AM",
-                     "12PM", "1PM", "2PM", "3PM", "4PM", "5PM", "6PM", "7PM", "8PM", "9PM", "10PM", "11PM"]
-        day_names = ['Monday', 'Tuesday', 'Wednesday', 'Thursday', 'Friday', 'Saturday', 'Sunday']
-        
         temporal_text = f"""
-        Most active hour: {hour_names[stats.most_active_hour]} with {stats.messages_by_hour.get(stats.most_active_hour, 0):,} messages
+        Most active hour: {HOUR_NAMES[stats.most_active_hour]} with {stats.messages_by_hour.get(stats.most_active_hour, 0):,} messages
         <br/>
-        Most active day: {day_names[stats.most_active_day]} with {stats.messages_by_day_of_week.get(stats.most_active_day, 0):,} messages
+        Most active day: {DAY_NAMES[stats.most_active_day]} with {stats.messages_by_day_of_week.get(stats.most_active_day, 0):,} messages
         """
         
         content.append(Paragraph(temporal_text, self.normal_style))
@@ -278,7 +274,7 @@ class StatsExporter:
         content.append(Paragraph("Weekly Distribution", self.subheading_style))
         
         weekly_data = [["Day", "Messages", "Percentage"]]
-        for day, name in enumerate(day_names):
+        for day, name in enumerate(DAY_NAMES):
             count = stats.messages_by_day_of_week.get(day, 0)
             percentage = (count / total_messages) * 100 if total_messages > 0 else 0
             weekly_data.append([name, f"{count:,}", f"{percentage:.1f}%"])
@@ -2,6 +2,7 @@
 
 import sys
 import os
+import multiprocessing
 from typing import Dict, List, Optional, Set, Tuple
 import platform
 import json
@@ -1982,4 +1983,6 @@ def main():
 
 
 if __name__ == "__main__":
+    # Required for the sentiment analyzer's process pool in frozen builds
+    multiprocessing.freeze_support()
     main()
\ No newline at end of file